@@ -1,7 +1,9 @@
 import glob
 import logging
+import os
 import re
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import hou
 
@@ -10,46 +12,104 @@ from . import widgets
 
 logger = logging.getLogger(__name__)
 
+_COLLECTION_PATTERN = re.compile(r'\$F{?\d*}?|<UDIM>')
+_WILDCARD_CHARS = frozenset('$<#%*?[')
+
+_PARM_TYPE_MAP = {
+    hou.fileType.Any: schema.ParmTypes.FILE,
+    hou.fileType.Geometry: schema.ParmTypes.GEOMETRY,
+    hou.fileType.Image: schema.ParmTypes.IMAGE,
+    hou.fileType.Directory: schema.ParmTypes.DIRECTORY,
+}
+
+
+_SCAN_CHUNK_SIZE = 256
+
 
 class HoudiniHost:
+    # Scanning only reads from HOM (rawValue, parmTemplate, evalAtFrame),
+    # which is generally thread-safe, but keep threaded scans opt-in.
+    threaded: bool = False
+
     def __init__(self) -> None:
         widgets.patch_collapsible_box()
 
     def get_items(self, selected: bool = False) -> tuple[schema.Item, ...]:
-        items = []
-
         if selected:
             nodes = hou.selectedNodes()
         else:
             nodes = hou.node('/').allSubChildren(recurse_in_locked_nodes=False)
 
+        if self.threaded and len(nodes) > _SCAN_CHUNK_SIZE:
+            chunks = [
+                nodes[i : i + _SCAN_CHUNK_SIZE]
+                for i in range(0, len(nodes), _SCAN_CHUNK_SIZE)
+            ]
+            items = []
+            with ThreadPoolExecutor() as executor:
+                for chunk_items in executor.map(self._scan_nodes, chunks):
+                    items.extend(chunk_items)
+            return tuple(items)
+
+        return tuple(self._scan_nodes(nodes))
+
+    @staticmethod
+    def _scan_nodes(nodes: Sequence[hou.Node]) -> list[schema.Item]:
+        """Return the items for a sequence of nodes."""
+
+        # This loop visits every parm in the scene, so bind hot lookups to
+        # locals and filter out non-string parms before building items.
+        get_item = HoudiniHost._get_item
+        string_type = hou.parmTemplateType.String
+
+        # Cache the parm names known to carry string templates per node
+        # type. Only positive verdicts are cached: a name can be a string
+        # spare parm on one instance of a type and a different type on
+        # another, so a cached False could silently drop parms, while a
+        # stale True only costs _get_item a wasted call.
+        type_parms: dict[hou.NodeType, set[str]] = {}
+
+        items = []
+        append = items.append
         for node in nodes:
+            string_names = type_parms.get(node_type := node.type())
+            if string_names is None:
+                string_names = type_parms[node_type] = set()
             for parm in node.parms():
-                if item := self._get_item(node, parm):
-                    items.append(item)
-
-        return tuple(items)
+                if parm.name() not in string_names:
+                    if parm.parmTemplate().type() != string_type:
+                        continue
+                    string_names.add(parm.name())
+                if item := get_item(node, parm):
+                    append(item)
+        return items
 
     def update_items(self, items: Sequence[schema.Item]) -> None:
+        # Resolve each node once; items commonly share a node.
+        nodes: dict[str, hou.Node | None] = {}
         for item in items:
             if not item.preview.raw:
                 continue
-            if node := hou.node(item.node_path):
+            if item.node_path in nodes:
+                node = nodes[item.node_path]
+            else:
+                node = nodes[item.node_path] = hou.node(item.node_path)
+            if node:
                 if parm := node.parm(item.parm_name):
                     parm.set(item.preview.raw)
 
     @staticmethod
     def _get_item(node: hou.Node, parm: hou.Parm) -> schema.Item | None:
-        template = parm.parmTemplate()
-        if not isinstance(template, hou.StringParmTemplate):
-            return None
-
         raw = parm.rawValue()
         if not raw:
             return None
 
+        template = parm.parmTemplate()
+        if not isinstance(template, hou.StringParmTemplate):
+            return None
+
         if template.stringType() == hou.stringParmType.FileReference:
-            parm_type = HoudiniHost._get_parm_type(template.fileType())
+            parm_type = _PARM_TYPE_MAP.get(template.fileType())
 
         # Handle nodes such as LOP Reference, Sublayer
         elif template.stringType() == hou.stringParmType.Regular:
@@ -68,6 +128,12 @@ class HoudiniHost:
 
         if '`' in raw:
             status = schema.Statuses.EXPRESSION
+        elif not _WILDCARD_CHARS.intersection(raw):
+            # Literal paths don't need a glob.
+            if os.path.exists(expanded):
+                status = schema.Statuses.FOUND
+            else:
+                status = schema.Statuses.MISSING
         else:
             files = HoudiniHost.expand_files(raw)
             if files:
@@ -85,27 +151,21 @@ class HoudiniHost:
         )
         return item
 
-    @staticmethod
-    def _get_parm_type(file_type: hou.fileType) -> schema.ParmType | None:
-        parm_types = {
-            hou.fileType.Any: schema.ParmTypes.FILE,
-            hou.fileType.Geometry: schema.ParmTypes.GEOMETRY,
-            hou.fileType.Image: schema.ParmTypes.IMAGE,
-            hou.fileType.Directory: schema.ParmTypes.DIRECTORY,
-        }
-        return parm_types.get(file_type)
-
     @staticmethod
     def expand_string(text: str, expand_frame: bool = False) -> str:
-        if expand_frame:
+        if expand_frame or '$F' not in text:
             return hou.text.expandString(text)
         else:
-            safe = re.sub(r'\$F', r'<F>', text)
+            safe = text.replace('$F', '<F>')
             return hou.text.expandString(safe).replace('<F>', '$F')
 
     @staticmethod
     def expand_files(path: str) -> tuple[str, ...]:
+        # Literal paths need a single stat instead of a glob walk.
+        if not _WILDCARD_CHARS.intersection(path):
+            return (path,) if os.path.exists(path) else ()
+
         absolute_path = HoudiniHost.expand_string(path)
-        glob_pattern = re.sub(r'\$F{?\d*}?|<UDIM>', '*', absolute_path)
+        glob_pattern = _COLLECTION_PATTERN.sub('*', absolute_path)
         files = glob.glob(glob_pattern)
         return tuple(sorted(files))
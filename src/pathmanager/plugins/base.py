@@ -1,13 +1,48 @@
 import difflib
 import html
 import logging
+import os
+import re
 from abc import ABC
+from functools import lru_cache
 from typing import Sequence
 
 from qt_parameters import ParameterForm
 from qtpy import QtGui, QtWidgets
 
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    Levenshtein = None
+
 from pathmanager import schema, utils
+from pathmanager.houdini import HoudiniHost
+
+# Frame and UDIM tokens that expand to file collections.
+COLLECTION_PATTERN = re.compile(r'\$F{?\d*}?|<UDIM>')
+
+
+def expand_cached(text: str, cache: dict[str, str]) -> str:
+    """
+    Expand a raw path through HoudiniHost.expand_string, caching per unique
+    string; identical raw paths are common across items and each expansion
+    is a HOM call.
+    """
+
+    if text not in cache:
+        cache[text] = HoudiniHost.expand_string(text)
+    return cache[text]
+
+
+def list_dir(directory: str, cache: dict[str, tuple[str, ...]]) -> tuple[str, ...]:
+    """List a directory once per cache; an empty directory means the cwd."""
+
+    if directory not in cache:
+        try:
+            cache[directory] = tuple(os.listdir(directory or os.curdir))
+        except OSError:
+            cache[directory] = ()
+    return cache[directory]
 
 
 class Plugin(ABC):
@@ -34,37 +69,69 @@ class Plugin(ABC):
 
     @staticmethod
     def _get_html(str1, str2):
-        str1 = html.escape(str1)
-        str2 = html.escape(str2)
-
-        matcher = difflib.SequenceMatcher(None, str1, str2)
-        diff = matcher.get_opcodes()
-
         palette = QtWidgets.QApplication.palette()
         color = palette.color(QtGui.QPalette.ColorRole.Accent)
         color.setAlphaF(0.5)
+        return _diff_html(str1, str2, color_to_html_rgba(color))
+
+
+@lru_cache(maxsize=4096)
+def _diff_html(str1: str, str2: str, htmlcolor: str) -> str:
+    """Return str2 as HTML with changes against str1 highlighted."""
+
+    if str1 == str2:
+        return html.escape(str1)
+
+    # Strip the common prefix and suffix; path edits usually touch a small
+    # middle section and SequenceMatcher is quadratic over the rest.
+    limit = min(len(str1), len(str2))
+    prefix = 0
+    while prefix < limit and str1[prefix] == str2[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and str1[len(str1) - 1 - suffix] == str2[len(str2) - 1 - suffix]
+    ):
+        suffix += 1
+
+    middle1 = html.escape(str1[prefix : len(str1) - suffix])
+    middle2 = html.escape(str2[prefix : len(str2) - suffix])
+
+    # rapidfuzz produces the same opcodes as difflib from C++ when available.
+    if Levenshtein is not None:
+        diff = [
+            (op.tag, op.src_start, op.src_end, op.dest_start, op.dest_end)
+            for op in Levenshtein.opcodes(middle1, middle2)
+        ]
+    else:
+        matcher = difflib.SequenceMatcher(None, middle1, middle2)
+        diff = matcher.get_opcodes()
 
-        htmlcolor = color_to_html_rgba(color)
-
-        result = []
-        for tag, i1, i2, j1, j2 in diff:
-            if tag == 'equal':
-                result.append(str1[i1:i2])
-            elif tag == 'delete':
-                pass
-            elif tag == 'insert':
-                result.append(
-                    f'<span style="background-color: {htmlcolor};">{str2[j1:j2]}</span>'
-                )
-            elif tag == 'replace':
-                result.append(
-                    f'<span style="background-color: {htmlcolor};">{str2[j1:j2]}</span>'
-                )
-        return ''.join(result)
+    result = [html.escape(str1[:prefix])]
+    for tag, i1, i2, j1, j2 in diff:
+        if tag == 'equal':
+            result.append(middle1[i1:i2])
+        elif tag == 'delete':
+            pass
+        elif tag == 'insert':
+            result.append(
+                f'<span style="background-color: {htmlcolor};">{middle2[j1:j2]}</span>'
+            )
+        elif tag == 'replace':
+            result.append(
+                f'<span style="background-color: {htmlcolor};">{middle2[j1:j2]}</span>'
+            )
+    result.append(html.escape(str1[len(str1) - suffix :]) if suffix else '')
+    return ''.join(result)
 
 
 def color_to_html_rgba(color: QtGui.QColor) -> str:
-    r, g, b, a = color.getRgb()
+    return _format_rgba(*color.getRgb())
+
+
+@lru_cache(maxsize=256)
+def _format_rgba(r: int, g: int, b: int, a: int) -> str:
     if a == 255:
         return f"#{r:02x}{g:02x}{b:02x}"
     else:
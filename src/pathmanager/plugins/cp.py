@@ -1,11 +1,11 @@
+import fnmatch
 import glob
 import os
-import re
 import shutil
 from collections.abc import Sequence
 
 from .. import schema
-from pathmanager.houdini import HoudiniHost, PathParameter
+from pathmanager.houdini import PathParameter
 from qt_parameters import ParameterForm
 from . import base
 
@@ -22,12 +22,13 @@ class CopyPlugin(base.Plugin):
         if not destination:
             return
 
+        expand_cache: dict[str, str] = {}
         for item in items:
             if item.status != schema.Statuses.FOUND:
                 continue
 
             path = item.path.raw
-            absolute_path = HoudiniHost.expand_string(path)
+            absolute_path = base.expand_cached(path, expand_cache)
             tail = os.path.basename(absolute_path)
 
             if relative_root_enabled:
@@ -43,7 +44,9 @@ class CopyPlugin(base.Plugin):
             item.set_preview(new_path)
 
     def process(self, items: Sequence[schema.Item], kwargs: dict) -> None:
-        collection_pattern = re.compile(r'\$F{?\d*}?|<UDIM>')
+        expand_cache: dict[str, str] = {}
+        # Items commonly share a directory and glob re-lists it per call.
+        listings: dict[str, tuple[str, ...]] = {}
 
         # Collect operations
         operations = {}
@@ -51,14 +54,26 @@ class CopyPlugin(base.Plugin):
             if not item.preview.raw:
                 continue
 
-            absolute_path = HoudiniHost.expand_string(item.path.raw)
-            glob_pattern = collection_pattern.sub('*', absolute_path)
-            files = glob.glob(glob_pattern)
+            absolute_path = base.expand_cached(item.path.raw, expand_cache)
+            glob_pattern = base.COLLECTION_PATTERN.sub('*', absolute_path)
+            directory, name_pattern = os.path.split(glob_pattern)
+            if any(c in directory for c in '*?['):
+                files = glob.glob(glob_pattern)
+            else:
+                # fnmatch.filter folds case per platform the way glob does.
+                hidden = name_pattern.startswith('.')
+                files = [
+                    os.path.join(directory, name)
+                    for name in fnmatch.filter(
+                        base.list_dir(directory, listings), name_pattern
+                    )
+                    if hidden or not name.startswith('.')
+                ]
 
             if not files:
                 continue
 
-            absolute_preview = HoudiniHost.expand_string(item.preview.raw)
+            absolute_preview = base.expand_cached(item.preview.raw, expand_cache)
             destination = os.path.dirname(absolute_preview)
             operations[item.preview.raw] = (files, destination)
 
@@ -1,8 +1,8 @@
 import fnmatch
 import os
 import re
-from collections import defaultdict
-from collections.abc import Sequence
+from collections import defaultdict, deque
+from collections.abc import Iterator, Sequence
 
 from .. import schema
 from pathmanager.houdini import PathParameter
@@ -10,6 +10,32 @@ from qt_parameters import ParameterForm
 from . import base
 
 
+def _walk_files(root: str) -> Iterator[tuple[str, str]]:
+    """
+    Yield (directory, name) pairs for all files under a root.
+    Unlike os.walk this never stats entries or builds per-directory lists.
+    """
+
+    stack = deque((root,))
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    # Match os.walk: don't descend into symlinked directories
+                    # but do report symlinked files.
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield directory, entry.name
+                except OSError:
+                    continue
+
+
 class FindPlugin(base.Plugin):
     name = 'find'
 
@@ -20,30 +46,44 @@ class FindPlugin(base.Plugin):
         if not search_root:
             return
 
-        collection_pattern = re.compile(r'\$F{?\d*}?|<UDIM>')
-
         # Collect missing files
         missing_items = defaultdict(list)
         for item in items:
             if item.status == schema.Statuses.MISSING:
                 filename = os.path.basename(os.path.normpath(item.path.raw))
-                pattern = collection_pattern.sub('*', filename)
+                pattern = base.COLLECTION_PATTERN.sub('*', filename)
                 missing_items[pattern].append(item)
 
         if not missing_items:
             return
 
+        # One union regex tests every pattern in a single pass per file
+        # instead of running fnmatch per pattern per directory. Both sides
+        # are normcased so Windows keeps fnmatch's case folding.
+        normcase = os.path.normcase
+        patterns = tuple(missing_items)
+        combined = re.compile(
+            '|'.join(
+                f'(?P<g{i}>{fnmatch.translate(normcase(pattern))})'
+                for i, pattern in enumerate(patterns)
+            )
+        )
+
         # Find missing files
-        for root, dirs, files in os.walk(search_root):
-            for file, items in tuple(missing_items.items()):
-                if fnmatch.filter(files, file):
-                    for item in missing_items[file]:
-                        filename = os.path.basename(os.path.normpath(item.path.raw))
-                        path = os.path.join(root, filename)
-                        item.set_preview(path)
-                    del missing_items[file]
-                    if not missing_items:
-                        return
+        for root, file in _walk_files(search_root):
+            match = combined.match(normcase(file))
+            if match is None:
+                continue
+            pattern = patterns[int(match.lastgroup[1:])]
+            pattern_items = missing_items.pop(pattern, None)
+            if pattern_items is None:
+                continue
+            for item in pattern_items:
+                filename = os.path.basename(os.path.normpath(item.path.raw))
+                path = os.path.join(root, filename)
+                item.set_preview(path)
+            if not missing_items:
+                return
 
     def form(self) -> ParameterForm | None:
         form = ParameterForm('find')
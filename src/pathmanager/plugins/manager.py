@@ -1,12 +1,15 @@
+from __future__ import annotations
+
 from . import base, cp, find, mv, relative, replace, set_directory, version
 
 
 class PluginManager:
-    _instance = None
+    _instance: PluginManager | None = None
 
-    def __new__(cls, *args, **kwargs):
+    @classmethod
+    def instance(cls) -> PluginManager:
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            cls._instance = cls()
             cls._instance._init()
         return cls._instance
 
@@ -21,9 +24,10 @@ class PluginManager:
             relative.RelativePlugin(),
         )
         self._plugins = {plugin.name: plugin for plugin in plugins}
+        self._plugins_tuple = tuple(self._plugins.values())
 
     def get_plugins(self) -> tuple[base.Plugin, ...]:
-        return tuple(self._plugins.values())
+        return self._plugins_tuple
 
     def get(self, name: str) -> base.Plugin | None:
         return self._plugins.get(name)
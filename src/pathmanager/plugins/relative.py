@@ -1,6 +1,5 @@
 import enum
 import os.path
-import re
 from collections.abc import Sequence
 
 from .. import schema
@@ -24,12 +23,12 @@ class RelativePlugin(base.Plugin):
         mode = values.get('mode', '')
         parents = values.get('parents', 0)
 
+        expand_cache: dict[str, str] = {}
+
         # Absolute
         if mode == AnchorMethod.ABSOLUTE:
             for item in items:
-                path = item.path.raw
-                absolute_path = HoudiniHost.expand_string(path)
-                item.set_preview(absolute_path)
+                item.set_preview(base.expand_cached(item.path.raw, expand_cache))
             return
 
         # Relative
@@ -41,17 +40,38 @@ class RelativePlugin(base.Plugin):
             return
 
         root = HoudiniHost.expand_string(env)
+        # os.path.relpath re-normalizes the constant root on every call;
+        # precompute its parts and build relative paths by prefix comparison.
+        root_parts = os.path.abspath(root).split(os.sep)
+        relative_cache: dict[str, str | None] = {}
+
+        def relative(absolute: str) -> str | None:
+            if absolute in relative_cache:
+                return relative_cache[absolute]
+            parts = os.path.abspath(absolute).split(os.sep)
+            common = 0
+            for root_part, part in zip(root_parts, parts):
+                if root_part != part:
+                    break
+                common += 1
+            if common:
+                relative_parts = ['..'] * (len(root_parts) - common) + parts[common:]
+                result = os.sep.join(relative_parts) or os.curdir
+            else:
+                # Different drives; os.path.relpath raises here.
+                result = None
+            relative_cache[absolute] = result
+            return result
+
         for item in items:
             path = item.path.raw
-            absolute_path = HoudiniHost.expand_string(path)
-            try:
-                relative_path = os.path.relpath(absolute_path, root)
-            except ValueError:
+            relative_path = relative(base.expand_cached(path, expand_cache))
+            if relative_path is None:
                 continue
 
-            # Preserve '..'
-            parts = re.split(r'[\\/]', relative_path)
-            count = parts.count('..')
+            # Preserve '..'; relpath normalizes separators, so one C-level
+            # split suffices instead of a regex pass.
+            count = relative_path.split(os.sep).count('..')
 
             if count <= parents:
                 path = os.path.join(env, relative_path)
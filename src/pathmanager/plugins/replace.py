@@ -1,6 +1,7 @@
 import fnmatch
 import re
 from collections.abc import Sequence
+from functools import lru_cache
 
 from qt_material_icons import MaterialIcon
 from qt_parameters import BoolParameter, Label, ParameterForm, StringParameter
@@ -9,6 +10,13 @@ from .. import schema
 from . import base
 
 
+@lru_cache(maxsize=256)
+def _translate_glob(pattern: str) -> str:
+    """Translate a glob pattern to a regex pattern without the end anchor."""
+
+    return fnmatch.translate(pattern).removesuffix('\\Z')
+
+
 class ReplacePlugin(base.Plugin):
     name = 'replace'
 
@@ -22,26 +30,47 @@ class ReplacePlugin(base.Plugin):
         if not search:
             return
 
+        literal = not regex and not any(c in search for c in '*?[')
+        if literal and match_case:
+            # Literal search: a C-level replace, skipping untouched items.
+            for item in items:
+                raw = item.path.raw
+                if search in raw:
+                    item.set_preview(raw.replace(search, replace))
+            return
+
         try:
             flags = 0 if match_case else re.IGNORECASE
             if regex:
                 pattern = re.compile(search, flags=flags)
             else:
                 # The fnmatch case sensitivity depends on OS, so use re.compile.
-                pattern_str = fnmatch.translate(search)[:-2]
-                pattern = re.compile(pattern_str, flags=flags)
+                pattern = re.compile(_translate_glob(search), flags=flags)
 
                 # Escape special characters
                 replace = replace.encode('unicode_escape').decode('ascii')
         except re.error:
             return
 
+        # An invalid replacement template raises for every item alike, so
+        # validate it once instead of wrapping each substitution.
+        try:
+            pattern.sub(replace, '')
+        except re.error:
+            return
+
+        sub = pattern.sub
+        if literal:
+            # Case-insensitive literal: prefilter with a substring scan.
+            search_lower = search.lower()
+            for item in items:
+                raw = item.path.raw
+                if search_lower in raw.lower():
+                    item.set_preview(sub(replace, raw))
+            return
+
         for item in items:
-            try:
-                path = pattern.sub(replace, item.path.raw)
-            except re.error:
-                continue
-            item.set_preview(path)
+            item.set_preview(sub(replace, item.path.raw))
 
     def form(self) -> ParameterForm | None:
         form = ParameterForm(self.name)
@@ -16,12 +16,17 @@ class SetDirectoryPlugin(base.Plugin):
         if not directory:
             return
 
+        # Bind lookups to locals for the per-item loop.
+        expression = schema.Statuses.EXPRESSION
+        basename = os.path.basename
+        normpath = os.path.normpath
+        join = os.path.join
+
         for item in items:
-            if item.status == schema.Statuses.EXPRESSION:
+            if item.status is expression:
                 continue
 
-            filename = os.path.basename(os.path.normpath(item.path.raw))
-            path = os.path.join(directory, filename)
+            path = join(directory, basename(normpath(item.path.raw)))
             item.set_preview(path)
 
     def form(self) -> ParameterForm | None:
@@ -1,4 +1,6 @@
+import fnmatch
 import glob
+import os
 import re
 from collections.abc import Sequence
 from functools import lru_cache
@@ -10,6 +12,8 @@ from qt_parameters import ParameterForm
 from . import base
 from pathmanager.houdini import ComboParameter, HoudiniHost
 
+_VERSION_PATTERN = re.compile(r'([\\/._]v)(\d+)')
+
 
 class VersionPlugin(base.Plugin):
     name = 'version'
@@ -23,14 +27,17 @@ class VersionPlugin(base.Plugin):
             if item.status == schema.Statuses.EXPRESSION:
                 continue
 
-            versions = self._get_versions(item.path.raw)
+            path = item.path.raw
+            versions = _get_versions(path, HoudiniHost.expand_string(path))
             if not versions:
                 continue
 
+            # Select by version number; sorting the path strings is both
+            # O(N log N) and wrong for versions crossing a digit boundary.
             if mode == 'Latest':
-                item.set_preview(sorted(versions.values())[-1])
+                item.set_preview(versions[max(versions)])
             elif mode == 'Earliest':
-                item.set_preview(sorted(versions.values())[0])
+                item.set_preview(versions[min(versions)])
             else:
                 item.set_preview(versions.get(version, ''))
 
@@ -51,25 +58,59 @@ class VersionPlugin(base.Plugin):
 
         return form
 
-    @lru_cache
-    def _get_versions(self, path: str) -> dict[int, str]:
-        """Return a dictionary of version: raw paths."""
 
-        collection_pattern = re.compile(r'\$F{?\d*}?|<UDIM>')
-        version_pattern = re.compile(r'([\\/._]v)(\d+)')
+@lru_cache(maxsize=1024)
+def _get_versions(path: str, absolute_path: str) -> dict[int, str]:
+    """
+    Return a dictionary of version: raw paths.
+    The expanded path is part of the key so a change of $HIP or $JOB
+    invalidates the cached entry.
+    """
 
-        absolute_path = HoudiniHost.expand_string(path)
-        glob_pattern = collection_pattern.sub('*', absolute_path)
-        glob_pattern = version_pattern.sub(r'\1*', glob_pattern)
-        files = glob.glob(glob_pattern)
+    glob_pattern = base.COLLECTION_PATTERN.sub('*', absolute_path)
+    glob_pattern = _VERSION_PATTERN.sub(r'\1*', glob_pattern)
 
-        versions = {}
-        for file in files:
-            if match := version_pattern.search(file):
-                number = int(match.group(2))
-                version_path = version_pattern.sub(
-                    lambda m: f'{m.group(1)}{number:0{len(m.group(2))}d}', path
-                )
-                versions[number] = version_path
+    # Frame collections expand to thousands of files; when the wildcards are
+    # confined to the file name a single listing beats the glob walk.
+    directory, name_pattern = os.path.split(glob_pattern)
+    if any(c in directory for c in '*?['):
+        files = glob.glob(glob_pattern)
+    else:
+        try:
+            names = os.listdir(directory or os.curdir)
+        except OSError:
+            names = []
+        # fnmatch.filter folds case per platform the way glob does.
+        hidden = name_pattern.startswith('.')
+        files = [
+            os.path.join(directory, name)
+            for name in fnmatch.filter(names, name_pattern)
+            if hidden or not name.startswith('.')
+        ]
+
+    # Locate the version tokens in the raw path once; each file then only
+    # needs its number spliced in instead of a regex callback.
+    spans = [match.span(2) for match in _VERSION_PATTERN.finditer(path)]
+    if not spans:
+        return {}
+    widths = [end - start for start, end in spans]
+    parts = []
+    last = 0
+    for start, end in spans:
+        parts.append(path[last:start])
+        last = end
+    parts.append(path[last:])
+
+    versions = {}
+    for file in files:
+        if match := _VERSION_PATTERN.search(file):
+            number = int(match.group(2))
+            if number in versions:
+                continue
+            pieces = [parts[0]]
+            for width, part in zip(widths, parts[1:]):
+                pieces.append(f'{number:0{width}d}')
+                pieces.append(part)
+            versions[number] = ''.join(pieces)
 
-        return versions
+    return versions
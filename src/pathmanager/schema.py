@@ -25,20 +25,20 @@ class ParmTypes(metaclass=meta.IterMeta):
     STRING = ParmType('string', icon='text_snippet')
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NodeType:
     name: str
     category: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Item(meta.Sortable):
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Path:
         raw: str = ''
         expanded: str = ''
 
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Preview:
         raw: str = ''
         html: str = ''
@@ -53,7 +53,13 @@ class Item(meta.Sortable):
     status: Status = Statuses.MISSING
 
     def set_preview(self, path: str) -> None:
+        # Assign a fresh Preview instead of mutating, so the shared empty
+        # sentinel stays empty.
         if path == self.path.raw:
-            self.preview.raw = ''
+            self.preview = Item.EMPTY_PREVIEW
         else:
-            self.preview.raw = path.replace('\\', '/')
+            self.preview = Item.Preview(raw=path.replace('\\', '/'))
+
+
+# Shared sentinel for items without a preview; set_preview never mutates it.
+Item.EMPTY_PREVIEW = Item.Preview()
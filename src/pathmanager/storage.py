@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import json
 import logging
 import os
@@ -5,6 +7,11 @@ from typing import Any
 
 import platformdirs
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PACKAGE_NAME = 'houdini-pathmanager'
 
 logger = logging.getLogger(__name__)
@@ -13,9 +20,10 @@ logger = logging.getLogger(__name__)
 class JSONStorage:
     _instance = None
 
-    def __new__(cls, *args, **kwargs):
+    @classmethod
+    def instance(cls) -> JSONStorage:
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            cls._instance = cls()
             cls._instance._init()
         return cls._instance
 
@@ -23,15 +31,25 @@ class JSONStorage:
 
     @staticmethod
     def read(path: str) -> dict:
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(path, 'r') as f:
             return json.load(f)
 
     @staticmethod
     def write(data: Any, path: str) -> None:
-        if not os.path.exists(os.path.dirname(path)):
-            os.makedirs(os.path.dirname(path))
-        with open(path, 'w') as file:
-            json.dump(data, file, indent=2)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file and replace it for atomicity.
+        tmp_path = f'{path}.tmp'
+        if orjson is not None:
+            with open(tmp_path, 'wb') as file:
+                file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as file:
+                json.dump(data, file, indent=2)
+        os.replace(tmp_path, path)
 
 
 class Storage(JSONStorage):
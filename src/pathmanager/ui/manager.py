@@ -1,6 +1,7 @@
 import dataclasses
 import logging
-from functools import partial
+from functools import lru_cache, partial
+from typing import Any
 
 from qtpy import QtCore, QtGui, QtWidgets
 
@@ -25,12 +26,34 @@ from .tree import PathField, PreviewField
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def _asdict(obj: Any) -> Any:
+    """
+    Convert dataclasses to dicts for serialization.
+    Unlike dataclasses.asdict this caches the field reflection and skips the
+    deepcopy; the result is written straight to the state file.
+    """
+
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {name: _asdict(getattr(obj, name)) for name in _field_names(type(obj))}
+    if isinstance(obj, dict):
+        return {key: _asdict(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_asdict(value) for value in obj]
+    return obj
+
+
 class PathManager(QtWidgets.QWidget):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
 
         self._host = HoudiniHost()
         self._items = None
+        self._plugin_cache: tuple[str, Any] | None = None
 
         self._init_ui()
         self._load_preferences()
@@ -48,47 +71,44 @@ class PathManager(QtWidgets.QWidget):
         self.browser.model_expired.connect(self._load_items)
         layout.addWidget(self.browser)
 
-        self.browser.add_column(
-            field=Field('parm_name'),
-            filter_widget=BasicFilterWidget('Parm Name', cls=str),
-        )
-
-        self.browser.add_column(
-            field=Field('parm_type'),
-            filter_widget=StyledFilterWidget('Parm Type'),
-            delegate=StyledDelegate(),
-            visible=False,
-        )
-
-        self.browser.add_column(
-            field=Field('node_path'),
-            filter_widget=BasicFilterWidget('Node Path', cls=str),
-            visible=False,
-        )
-
-        self.browser.add_column(
-            field=Field('node_type.category', label='Node Category'),
-            filter_widget=BasicFilterWidget('Node Type Category', cls=str),
-            visible=False,
-        )
-
-        self.browser.add_column(
-            field=Field('node_type.name', label='Node Type'),
-            filter_widget=BasicFilterWidget('Node Type Name', cls=str),
-            visible=False,
-        )
-
-        self.browser.add_column(
-            field=Field('status'),
-            filter_widget=StyledFilterWidget('Status'),
-            delegate=StyledDelegate(),
+        columns = (
+            {
+                'field': Field('parm_name'),
+                'filter_widget': BasicFilterWidget('Parm Name', cls=str),
+            },
+            {
+                'field': Field('parm_type'),
+                'filter_widget': StyledFilterWidget('Parm Type'),
+                'delegate': StyledDelegate(),
+                'visible': False,
+            },
+            {
+                'field': Field('node_path'),
+                'filter_widget': BasicFilterWidget('Node Path', cls=str),
+                'visible': False,
+            },
+            {
+                'field': Field('node_type.category', label='Node Category'),
+                'filter_widget': BasicFilterWidget('Node Type Category', cls=str),
+                'visible': False,
+            },
+            {
+                'field': Field('node_type.name', label='Node Type'),
+                'filter_widget': BasicFilterWidget('Node Type Name', cls=str),
+                'visible': False,
+            },
+            {
+                'field': Field('status'),
+                'filter_widget': StyledFilterWidget('Status'),
+                'delegate': StyledDelegate(),
+            },
+            {
+                'field': PathField('path'),
+                'filter_widget': BasicFilterWidget('Path', cls=str),
+            },
+            {'field': PreviewField('preview')},
         )
-
-        self.browser.add_column(
-            field=PathField('path'), filter_widget=BasicFilterWidget('Path', cls=str)
-        )
-
-        self.browser.add_column(field=PreviewField('preview'))
+        self.browser.add_columns(columns)
 
         for widget in self.browser.filter_list.filter_widgets():
             widget.set_collapsed(False)
@@ -155,24 +175,35 @@ class PathManager(QtWidgets.QWidget):
 
         self._preview_items()
 
+    def _get_plugin(self, name: str) -> Any:
+        """Return a plugin, caching the last lookup; previews fire per keystroke."""
+
+        if self._plugin_cache and self._plugin_cache[0] == name:
+            return self._plugin_cache[1]
+        plugin = PluginManager.instance().get(name)
+        self._plugin_cache = (name, plugin)
+        return plugin
+
     def _refresh_items(self) -> None:
+        # refresh_column batches its change signals per parent.
         self.browser.model.refresh_column(7)
 
     def _preview_items(self) -> None:
         values = self.parameters.values()
         plugin_name = values['plugin']
-        plugin = PluginManager().get(plugin_name)
+        plugin = self._get_plugin(plugin_name)
 
         items = self.browser.elements()
+        empty = schema.Item.EMPTY_PREVIEW
         for item in items:
-            item.preview = schema.Item.Preview()
+            item.preview = empty
         plugin.preview(items, values)
         self._refresh_items()
 
     def _commit_items(self, selected: bool = False) -> None:
         values = self.parameters.values()
         plugin_name = values['plugin']
-        plugin = PluginManager().get(plugin_name)
+        plugin = self._get_plugin(plugin_name)
 
         if selected:
             items = self.browser.selected_elements()
@@ -190,15 +221,15 @@ class PathManager(QtWidgets.QWidget):
     def _save_preferences(self) -> None:
         values = self.parameters.values()
         browser_state = self.browser.state()
-        browser_data = dataclasses.asdict(browser_state)
+        browser_data = _asdict(browser_state)
         state = {
             'browser': browser_data,
             # 'parameters': values,
         }
-        Storage().set_state(state)
+        Storage.instance().set_state(state)
 
     def _load_preferences(self) -> None:
-        state = Storage().get_state()
+        state = Storage.instance().get_state()
 
         browser_data = state.get('browser', {})
         filters_data = browser_data.get('filters', {})
@@ -13,7 +13,7 @@ class Parameters(ParameterForm):
     def __init__(self, name: str = '', parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(name=name, parent=parent)
 
-        plugins = PluginManager().get_plugins()
+        plugins = PluginManager.instance().get_plugins()
         items = {plugin.label: plugin.name for plugin in plugins}
 
         parm = ComboParameter('plugin')
@@ -25,7 +25,6 @@ class Parameters(ParameterForm):
         self.forms = {}
         self.boxes = {}
 
-        max_height = self.minimumSizeHint().height()
         for plugin in plugins:
             form = plugin.form()
             self.forms[plugin.name] = form
@@ -33,10 +32,13 @@ class Parameters(ParameterForm):
             box = self.add_form(form)
             box.set_box_style(CollapsibleBox.Style.SIMPLE)
             box.header.setVisible(False)
-            max_height = max(max_height, self.minimumSizeHint().height())
             box.setVisible(False)
             self.boxes[plugin.name] = box
 
+        # Query the layout once after all children are inserted and size the
+        # form to fit the tallest plugin box.
+        box_heights = (box.minimumSizeHint().height() for box in self.boxes.values())
+        max_height = self.minimumSizeHint().height() + max(box_heights, default=0)
         self.setMinimumHeight(max_height)
 
         self.boxes[plugins[0].name].setVisible(True)
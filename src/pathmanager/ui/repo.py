@@ -10,6 +10,12 @@ from pathmanager.ui import manager
 
 logger = logging.getLogger(__name__)
 
+_SCREENSHOT_PATH = os.path.normpath(
+    os.path.join(
+        pathmanager.__file__, '..', '..', '.github', 'assets', 'screenshot.png'
+    )
+)
+
 
 def screenshot() -> None:
     """Capture a screenshot of the panel for the repository."""
@@ -37,9 +43,5 @@ def screenshot() -> None:
 def save_screenshot(widget: QtWidgets.QWidget) -> None:
     pixmap = widget.grab()
 
-    path = os.path.join(
-        pathmanager.__file__, '..', '..', '.github', 'assets', 'screenshot.png'
-    )
-    path = os.path.normpath(path)
-    pixmap.save(path)
-    logger.info(f'Screenshot saved: {path}')
+    pixmap.save(_SCREENSHOT_PATH)
+    logger.info(f'Screenshot saved: {_SCREENSHOT_PATH}')
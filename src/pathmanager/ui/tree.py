@@ -14,11 +14,17 @@ class PathField(Field):
         item.setToolTip(tooltip)
         return item
 
-    def refresh(self, value: schema.Item.Path, index: QtCore.QModelIndex) -> None:
+    def refresh(
+        self,
+        value: schema.Item.Path,
+        index: QtCore.QModelIndex,
+        model: QtCore.QAbstractItemModel | None = None,
+    ) -> None:
         text = value.raw if value is not None else ''
         tooltip = value.expanded if value is not None else ''
-        super().refresh(text, index)
-        index.model().setData(index, tooltip, ItemDataRole.ToolTipRole)
+        model = model or index.model()
+        super().refresh(text, index, model)
+        model.setData(index, tooltip, ItemDataRole.ToolTipRole)
 
 
 class PreviewField(Field):
@@ -27,9 +33,14 @@ class PreviewField(Field):
         item = super().create_item(text)
         return item
 
-    def refresh(self, value: schema.Item.Preview, index: QtCore.QModelIndex) -> None:
+    def refresh(
+        self,
+        value: schema.Item.Preview,
+        index: QtCore.QModelIndex,
+        model: QtCore.QAbstractItemModel | None = None,
+    ) -> None:
         text = value.raw if value is not None else ''
-        super().refresh(text, index)
+        super().refresh(text, index, model)
 
 
 class HtmlDelegate(StyledItemDelegate):
@@ -41,6 +52,16 @@ class HtmlDelegate(StyledItemDelegate):
         super().__init__(parent)
 
         self._document = QtGui.QTextDocument()
+        self._html: str | None = None
+        self._size = QtCore.QSize()
+
+    def _set_html(self, text: str) -> None:
+        """Parse the HTML only when the text changed since the last call."""
+
+        if text != self._html:
+            self._document.setHtml(text)
+            self._html = text
+            self._size = self._document.size().toSize()
 
     def paint(
         self,
@@ -50,7 +71,7 @@ class HtmlDelegate(StyledItemDelegate):
     ) -> None:
         self.initStyleOption(option, index)
 
-        self._document.setHtml(option.text)
+        self._set_html(option.text)
 
         if option.widget:
             style = option.widget.style()
@@ -93,7 +114,6 @@ class HtmlDelegate(StyledItemDelegate):
         self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex
     ) -> QtCore.QSize:
         self.initStyleOption(option, index)
-        self._document.setHtml(option.text)
-        size_hint = self._document.size().toSize()
-        size_hint += self._padding
+        self._set_html(option.text)
+        size_hint = self._size + self._padding
         return size_hint
@@ -2,36 +2,79 @@ import glob
 import os
 import re
 
+_CAMEL_PATTERN = re.compile(r'([a-z0-9])([A-Z])')
+
+# Frame and UDIM tokens that can appear in file paths.
+_TOKEN_PATTERN = re.compile(r'<UDIM>|%\(UDIM\)d|%0(\d)d|(#+)|\$F(\d?)')
+
 
 def title(text: str) -> str:
-    text = re.sub(r'([a-z0-9])([A-Z])', r'\g<1> \g<2>', text).replace('_', ' ').title()
+    text = _CAMEL_PATTERN.sub(r'\1 \2', text).replace('_', ' ').title()
     return text
 
 
-def find_files(path: str) -> tuple[str, ...]:
-    if os.path.exists(path):
-        return (path,)
+def _compile_patterns(path: str) -> tuple[re.Pattern | None, str]:
+    """
+    Build the matching regex and the glob pattern for a path with frame and
+    UDIM tokens in a single pass. The regex is None for token-less or
+    invalid paths.
+    """
+
+    re_parts = []
+    glob_parts = []
+    end = 0
+    for match in _TOKEN_PATTERN.finditer(path):
+        literal = path[end : match.start()]
+        re_parts.append(literal)
+        glob_parts.append(literal)
+
+        token = match.group()
+        if token in ('<UDIM>', '%(UDIM)d'):
+            re_parts.append(r'(1\d{3})')
+        elif token.startswith('%'):
+            re_parts.append(f'(\\d{{{match.group(1)}}})')
+        elif token.startswith('#'):
+            re_parts.append(f'(\\d{{{len(token)}}})')
+        elif match.group(3):
+            re_parts.append(f'(\\d{{{match.group(3)}}})')
+        else:
+            re_parts.append(r'(\d+)')
+        glob_parts.append('*')
+        end = match.end()
+
+    if end == 0:
+        return None, path
+
+    literal = path[end:]
+    re_parts.append(literal)
+    glob_parts.append(literal)
 
     try:
-        re_pattern = re.sub(r'<UDIM>', r'(1\\d{3})', path)
-        re_pattern = re.sub(r'%(UDIM)d', r'(1\\d{3})', re_pattern)
-        re_pattern = re.sub(r'%0(\d)d', lambda m: f'(\d{{{m.group(1)}}})', re_pattern)
-        re_pattern = re.sub(r'#+', lambda m: f'(\d{{{len(m.group())}}})', re_pattern)
-        re_pattern = re.sub(r'\$F(\d)', lambda m: f'(\d{{{m.group(1)}}})', re_pattern)
-        re_pattern = re.sub(r'\$F', lambda m: f'(\d+)', re_pattern)
-        re_compile = re.compile(re_pattern)
+        re_compile = re.compile(''.join(re_parts))
     except re.error:
-        return tuple()
+        re_compile = None
+    return re_compile, ''.join(glob_parts)
 
-    if re_pattern == path:
-        return tuple()
 
-    glob_pattern = re.sub(r'<UDIM>', '*', path)
-    glob_pattern = re.sub(r'\$F\d?', '*', glob_pattern)
-    glob_pattern = re.sub(r'#+', '*', glob_pattern)
-    glob_pattern = re.sub(r'%0\dd', '*', glob_pattern)
+def find_files(path: str) -> tuple[str, ...]:
+    if os.path.exists(path):
+        return (path,)
+
+    re_compile, glob_pattern = _compile_patterns(path)
+    if re_compile is None:
+        return tuple()
 
-    all_files = glob.glob(glob_pattern)
-    files = [file for file in all_files if re_compile.match(file)]
+    # Scan the parent directory directly when the wildcards are confined to
+    # the file name; glob would enumerate unrelated directories. The pattern
+    # is unanchored, so match the full path like the glob prefilter does.
+    root = os.path.dirname(glob_pattern)
+    if root and not any(c in root for c in '*?[') and os.path.isdir(root):
+        try:
+            with os.scandir(root) as entries:
+                files = [e.path for e in entries if re_compile.fullmatch(e.path)]
+        except OSError:
+            return tuple()
+    else:
+        files = [file for file in glob.glob(glob_pattern) if re_compile.match(file)]
 
     return tuple(sorted(files))
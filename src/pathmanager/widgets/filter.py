@@ -4,6 +4,7 @@ import dataclasses
 import enum
 import logging
 import operator
+from collections import deque
 from collections.abc import Container
 from typing import Any, Callable, Optional, Sequence
 
@@ -32,11 +33,25 @@ def is_not_in(a: Any, b: Container) -> bool:
     return a not in b
 
 
+def icontains(a: Any, b: str) -> bool:
+    """Case-insensitive contains; the needle is expected lowercased."""
+
+    return b in str(a).lower()
+
+
+def _accept_all(value: Any) -> bool:
+    return True
+
+
 class Filter:
-    value: Any = None
-    match: Optional[Callable] = operator.eq
-    role: QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole
-    inverted: bool = False
+    __slots__ = ('_value', '_match', 'role', '_inverted', '_predicate')
+
+    def __init__(self) -> None:
+        self._value: Any = None
+        self._match: Optional[Callable] = operator.eq
+        self.role: QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole
+        self._inverted: bool = False
+        self._update_predicate()
 
     def __repr__(self) -> str:
         match = self.match.__name__ if self.match else None
@@ -47,19 +62,65 @@ class Filter:
             f'role={self.role})'
         )
 
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+        self._update_predicate()
+
+    @property
+    def match(self) -> Optional[Callable]:
+        return self._match
+
+    @match.setter
+    def match(self, match: Optional[Callable]) -> None:
+        self._match = match
+        self._update_predicate()
+
+    @property
+    def inverted(self) -> bool:
+        return self._inverted
+
+    @inverted.setter
+    def inverted(self, inverted: bool) -> None:
+        self._inverted = inverted
+        self._update_predicate()
+
     def accepts(self, value: Any) -> bool:
-        if self.match is None or value is None:
-            return True
+        return self._predicate(value)
+
+    def _update_predicate(self) -> None:
+        """Compile the row decision into a single callable.
 
+        accepts runs once per row per column during filtering; the branches
+        on match and the filter value only change with the filter itself.
+        """
+
+        match = self._match
+        value = self._value
         # Note: Allow values like 0 but not other falsy values.
-        if self.value == 0:
-            pass
-        elif not self.value:
-            return True
-        return self.match(value, self.value) != self.inverted
+        if match is None or (value != 0 and not value):
+            self._predicate = _accept_all
+            return
+
+        if match is icontains:
+            # Lowercase the needle once instead of per row.
+            value = str(value).lower()
+
+        inverted = self._inverted
+
+        def predicate(v: Any, match=match, value=value, inverted=inverted) -> bool:
+            if v is None:
+                return True
+            return match(v, value) != inverted
 
+        self._predicate = predicate
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class FilterState:
     value: Any = None
     inverted: bool = False
@@ -69,6 +130,23 @@ class FilterState:
 class FilterWidget(CollapsibleBox):
     filter_changed = QtCore.Signal(Filter)
 
+    # Icons shared across all filter widgets; built on first construction.
+    _invert_icon: MaterialIcon | None = None
+    _undo_icon: MaterialIcon | None = None
+
+    @classmethod
+    def _shared_icons(cls) -> tuple[MaterialIcon, MaterialIcon]:
+        if FilterWidget._invert_icon is None:
+            invert_icon = MaterialIcon('block')
+            palette = QtWidgets.QApplication.palette()
+            color = palette.color(ColorGroup.Normal, ColorRole.WindowText)
+            invert_icon.set_color(color, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+            color = palette.color(ColorGroup.Disabled, ColorRole.WindowText)
+            invert_icon.set_color(color, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+            FilterWidget._invert_icon = invert_icon
+            FilterWidget._undo_icon = MaterialIcon('undo')
+        return FilterWidget._invert_icon, FilterWidget._undo_icon
+
     def __init__(
         self, title: str = '', parent: QtWidgets.QWidget | None = None
     ) -> None:
@@ -76,6 +154,9 @@ class FilterWidget(CollapsibleBox):
 
         self._filter = Filter()
         self._default: Any = None
+        self._bold: bool | None = None
+        self._font_normal: QtGui.QFont | None = None
+        self._font_bold: QtGui.QFont | None = None
 
     def _init_ui(self) -> None:
         super()._init_ui()
@@ -88,12 +169,7 @@ class FilterWidget(CollapsibleBox):
         header_layout = self.header.layout()
         header_layout.setSpacing(0)
 
-        invert_icon = MaterialIcon('block')
-        palette = QtWidgets.QApplication.palette()
-        color = palette.color(ColorGroup.Normal, ColorRole.WindowText)
-        invert_icon.set_color(color, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
-        color = palette.color(ColorGroup.Disabled, ColorRole.WindowText)
-        invert_icon.set_color(color, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        invert_icon, undo_icon = self._shared_icons()
 
         self.invert_button = QtWidgets.QToolButton()
         self.invert_button.setIcon(invert_icon)
@@ -104,7 +180,7 @@ class FilterWidget(CollapsibleBox):
         header_layout.insertWidget(header_layout.count() - 1, self.invert_button)
 
         self.reset_button = QtWidgets.QToolButton()
-        self.reset_button.setIcon(MaterialIcon('undo'))
+        self.reset_button.setIcon(undo_icon)
         self.reset_button.setAutoRaise(True)
         self.reset_button.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
         self.reset_button.setEnabled(False)
@@ -176,13 +252,18 @@ class FilterWidget(CollapsibleBox):
 
     def _refresh(self) -> None:
         has_changes = self._filter.value != self._default
-        if has_changes:
-            weight = QtGui.QFont.Weight.Bold
-        else:
-            weight = QtGui.QFont.Weight.Normal
-        font = self.title_label.font()
-        font.setWeight(weight)
-        self.title_label.setFont(font)
+
+        # Only touch the font when the weight flips; font() returns a copy
+        # and string filters refresh per keystroke.
+        if has_changes != self._bold:
+            self._bold = has_changes
+            if self._font_normal is None:
+                self._font_normal = QtGui.QFont(self.title_label.font())
+                self._font_normal.setWeight(QtGui.QFont.Weight.Normal)
+                self._font_bold = QtGui.QFont(self._font_normal)
+                self._font_bold.setWeight(QtGui.QFont.Weight.Bold)
+            font = self._font_bold if has_changes else self._font_normal
+            self.title_label.setFont(font)
 
         self.reset_button.setEnabled(has_changes)
 
@@ -197,7 +278,10 @@ class MultiFilterWidget(FilterWidget):
         self._filter.match = is_in
         self._default = set()
         self._values = ()
+        self._value_labels: tuple[str, ...] = ()
         self._checkboxes: tuple[QtWidgets.QCheckBox, ...] = ()
+        self._checkbox_map: dict[Any, QtWidgets.QCheckBox] = {}
+        self._checkboxes_dirty = False
 
     def set_value(self, value: Sequence) -> None:
         """Set the value, if the value doesn't exist, add it."""
@@ -224,11 +308,27 @@ class MultiFilterWidget(FilterWidget):
         This filters None values, sorts and ensures unique values.
         """
 
-        values = tuple(sorted(set(v for v in values if v is not None)))
+        # Sort by the rendered label so heterogeneous columns get a stable
+        # order, and keep the strings for the checkbox labels.
+        pairs = sorted((str(v), v) for v in set(values) if v is not None)
+        values = tuple(v for _, v in pairs)
         if self._values != values:
             self._values = values
+            self._value_labels = tuple(label for label, _ in pairs)
+            # The filter list starts collapsed; defer the checkbox churn for
+            # hidden widgets until they are first shown.
+            if self.isVisible():
+                self._update_checkboxes()
+                self._refresh_checkboxes()
+            else:
+                self._checkboxes_dirty = True
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        if self._checkboxes_dirty:
+            self._checkboxes_dirty = False
             self._update_checkboxes()
             self._refresh_checkboxes()
+        super().showEvent(event)
 
     def _checkbox_toggled(self) -> None:
         values = []
@@ -238,24 +338,42 @@ class MultiFilterWidget(FilterWidget):
         super().set_value(set(values))
 
     def _update_checkboxes(self) -> None:
-        """Rebuild the checkboxes to match all values."""
+        """Update the checkboxes to match all values, reusing existing ones."""
 
-        self._clear_layout()
+        layout = self.layout()
+
+        # Remove checkboxes for values that disappeared.
+        removed = set(self._checkbox_map) - set(self._values)
+        for value in removed:
+            checkbox = self._checkbox_map.pop(value)
+            layout.removeWidget(checkbox)
+            checkbox.deleteLater()
+
+        # Create missing checkboxes and order them to match the values.
         checkboxes = []
-        for value in self._values:
-            checkbox = QtWidgets.QCheckBox()
-            checkbox.setText(str(value))
-            checkbox.toggled.connect(self._checkbox_toggled)
+        for index, (value, label) in enumerate(zip(self._values, self._value_labels)):
+            checkbox = self._checkbox_map.get(value)
+            if checkbox is None:
+                checkbox = QtWidgets.QCheckBox()
+                checkbox.setText(label)
+                checkbox.toggled.connect(self._checkbox_toggled)
+                self._checkbox_map[value] = checkbox
+            layout.insertWidget(index, checkbox)
             checkboxes.append(checkbox)
-            self.layout().addWidget(checkbox)
         self._checkboxes = tuple(checkboxes)
 
     def _refresh_checkboxes(self) -> None:
         """Refresh the checked status on the checkboxes."""
 
+        selected = frozenset(self._filter.value)
         for checkbox, value in zip(self._checkboxes, self._values):
+            checked = value in selected
+            # Skip checkboxes that are already correct; every setChecked
+            # schedules a repaint.
+            if checkbox.isChecked() == checked:
+                continue
             checkbox.blockSignals(True)
-            checkbox.setChecked(value in self._filter.value)
+            checkbox.setChecked(checked)
             checkbox.blockSignals(False)
 
 
@@ -373,6 +491,14 @@ class BasicFilterWidget(FilterWidget):
         cls: type[BasicType] = str,
     ) -> None:
         super().__init__(title, parent)
+
+        # Debounce string input so typing doesn't re-filter per character.
+        self._pending: str = ''
+        self._debounce = QtCore.QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(100)
+        self._debounce.timeout.connect(self._apply_pending)
+
         self._update_parm(cls)
 
     def value(self) -> BasicType:
@@ -400,7 +526,7 @@ class BasicFilterWidget(FilterWidget):
             self.parm = IntParameter()
         elif issubclass(cls, str):
             self.parm = StringParameter()
-            self._filter.match = operator.contains
+            self._filter.match = icontains
         elif issubclass(cls, bool):
             self.parm = BoolParameter()
 
@@ -409,9 +535,20 @@ class BasicFilterWidget(FilterWidget):
         else:
             self._default = self.parm.default()
 
-        self.parm.value_changed.connect(super().set_value)
+        # Other parameter types change deliberately and skip the debounce.
+        if issubclass(cls, str):
+            self.parm.value_changed.connect(self._queue_value)
+        else:
+            self.parm.value_changed.connect(super().set_value)
         self.layout().addWidget(self.parm)
 
+    def _queue_value(self, value: str) -> None:
+        self._pending = value
+        self._debounce.start()
+
+    def _apply_pending(self) -> None:
+        super().set_value(self._pending)
+
 
 class FilterListWidget(VerticalScrollArea):
     filter_changed = QtCore.Signal(Filter)
@@ -420,7 +557,13 @@ class FilterListWidget(VerticalScrollArea):
         super().__init__(parent)
 
         self._model: QtGui.QStandardItemModel | None = None
-        self._widgets: dict[int, FilterWidget] = {}
+        # Indexed by column; columns are small dense ints.
+        self._widgets: list[FilterWidget | None] = []
+        self._model_revision = 0
+        self._column_cache: dict[tuple[int, int], tuple[int, tuple]] = {}
+
+        # Disable to defer refreshes while adding many filter widgets.
+        self.auto_refresh = True
 
         self._init_ui()
 
@@ -441,8 +584,11 @@ class FilterListWidget(VerticalScrollArea):
         index = self._layout.count() - 1
         self._layout.insertWidget(index, widget)
         widget.filter_changed.connect(self.filter_changed.emit)
+        while len(self._widgets) <= column:
+            self._widgets.append(None)
         self._widgets[column] = widget
-        self.refresh_column(column)
+        if self.auto_refresh:
+            self.refresh_column(column)
 
     def remove_filter_widget(
         self, column: int = -1, widget: FilterWidget | None = None
@@ -450,31 +596,50 @@ class FilterListWidget(VerticalScrollArea):
         """Remove a FilterWidget. Either provide a column or a widget."""
 
         if column < 0:
-            for c, w in self._widgets.items():
+            for c, w in enumerate(self._widgets):
                 if w == widget:
                     column = c
                     break
-        widget = self._widgets.get(column)
-        if widget:
-            self._layout.removeWidget(widget)
-            widget.deleteLater()
+        if 0 <= column < len(self._widgets):
+            widget = self._widgets[column]
+            if widget:
+                self._layout.removeWidget(widget)
+                widget.deleteLater()
+                self._widgets[column] = None
 
     def filter_widgets(self) -> tuple[FilterWidget, ...]:
-        return tuple(self._widgets.values())  # noqa
+        return tuple(widget for widget in self._widgets if widget is not None)
 
     def filters(self) -> dict[int, Filter]:
-        return {column: widget.filter() for column, widget in self._widgets.items()}
+        return {
+            column: widget.filter()
+            for column, widget in enumerate(self._widgets)
+            if widget is not None
+        }
 
     def model(self) -> QtGui.QStandardItemModel:
         return self._model
 
     def set_model(self, model: QtGui.QStandardItemModel) -> None:
         self._model = model
+        self._column_cache.clear()
+        self._bump_revision()
+
+        # Any model change invalidates the cached column values.
+        model.dataChanged.connect(self._bump_revision)
+        model.rowsInserted.connect(self._bump_revision)
+        model.rowsRemoved.connect(self._bump_revision)
+        model.modelReset.connect(self._bump_revision)
+
         self.refresh()
 
+    def _bump_revision(self) -> None:
+        self._model_revision += 1
+
     def refresh(self) -> None:
-        for column, widget in self._widgets.items():
-            self.refresh_column(column)
+        for column, widget in enumerate(self._widgets):
+            if widget is not None:
+                self.refresh_column(column)
 
     def refresh_column(self, column: int) -> None:
         """
@@ -482,7 +647,7 @@ class FilterListWidget(VerticalScrollArea):
         If the model has updated, this is used to rebuild the values in
         MultiFilterWidgets.
         """
-        widget = self._widgets.get(column)
+        widget = self._widgets[column] if 0 <= column < len(self._widgets) else None
         if not widget or not self._model:
             return
 
@@ -490,7 +655,15 @@ class FilterListWidget(VerticalScrollArea):
         if enabled and isinstance(widget, MultiFilterWidget):
             value = widget.value()
             role = widget.filter().role
-            values = self._get_column_values(column, role)
+
+            # Reuse the cached values when the model hasn't changed.
+            key = (column, int(role))
+            cached = self._column_cache.get(key)
+            if cached is not None and cached[0] == self._model_revision:
+                values = cached[1]
+            else:
+                values = self._get_column_values(column, role)
+                self._column_cache[key] = (self._model_revision, values)
             widget.set_values(values)
 
             # After setting the new values, restore the original state.
@@ -505,16 +678,23 @@ class FilterListWidget(VerticalScrollArea):
         role: QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole,
         parent: QtCore.QModelIndex | None = None,
     ) -> tuple:
-        """Return all values of a column for a given role recursively."""
+        """Return all values of a column for a given role."""
 
-        values = set()
         if parent is None:
             parent = QtCore.QModelIndex()
 
-        for row in range(self._model.rowCount(parent)):
-            index = self._model.index(row, column, parent)
-            value = index.data(role)
-            values.add(value)
-            sibling_index = index.siblingAtColumn(0)
-            values.update(self._get_column_values(column, role, sibling_index))
+        # Walk iteratively into one accumulating set; recursion allocates a
+        # set per level and this runs on every model refresh.
+        model_index = self._model.index
+        row_count = self._model.rowCount
+
+        values = set()
+        add = values.add
+        stack = deque((parent,))
+        while stack:
+            parent = stack.pop()
+            for row in range(row_count(parent)):
+                index = model_index(row, column, parent)
+                add(index.data(role))
+                stack.append(index.siblingAtColumn(0))
         return tuple(values)
@@ -22,7 +22,7 @@ class RadioMenu(QtWidgets.QMenu):
 
         self.action_group.addAction(action)
         action.setChecked(checked)
-        action.triggered.connect(lambda: self.selection_changed.emit(data))
+        action.triggered.connect(self._action_triggered)
 
         self.addAction(action)
 
@@ -32,19 +32,33 @@ class RadioMenu(QtWidgets.QMenu):
         If `items` is a Mapping type, it is expected to be in the form of {label: data}.
         """
 
-        self.clear()
-
         if isinstance(items, Mapping):
             items = items
         else:
             items = {i: i for i in items}
 
+        # Reuse the existing actions when the labels match; QAction
+        # construction and menu insertion are expensive. The triggered slot
+        # reads data from the sender, so updating it in place is safe.
+        actions = [action for action in self.actions() if action.isCheckable()]
+        if actions and [action.text() for action in actions] == list(items):
+            for index, (action, data) in enumerate(zip(actions, items.values())):
+                action.setData(data)
+                action.setChecked(index == 0)
+            return
+
+        self.clear()
+
         # Add items
         checked = True
         for label, data in items.items():
             self.add_item(label, data, checked)
             checked = False
 
+    def _action_triggered(self) -> None:
+        if action := self.sender():
+            self.selection_changed.emit(action.data())
+
     def selection(self) -> Any:
         action = self.action_group.checkedAction()
         item = action.data()
@@ -75,9 +89,19 @@ class SelectionMenu(QtWidgets.QMenu):
         self.addAction(action)
 
     def clear_items(self) -> None:
-        for action in self.actions():
-            if action.isCheckable():
-                self.removeAction(action)
+        actions = [action for action in self.actions() if action.isCheckable()]
+        if not actions:
+            return
+
+        # Each removeAction relayouts the menu; suppress updates and signals
+        # for the batch.
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        for action in actions:
+            self.removeAction(action)
+            action.deleteLater()
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
 
     def add_item(self, label: str, data: Any, checked: bool = True) -> None:
         action = QtWidgets.QAction(self)
@@ -85,7 +109,7 @@ class SelectionMenu(QtWidgets.QMenu):
         action.setCheckable(True)
         action.setChecked(checked)
         action.setData(data)
-        action.triggered.connect(lambda: self._item_toggled())
+        action.triggered.connect(self._item_toggled)
         self.addAction(action)
 
     def set_items(self, items: Sequence | Mapping) -> None:
@@ -110,6 +134,11 @@ class SelectionMenu(QtWidgets.QMenu):
         return selection
 
     def set_selection(self, items: Sequence) -> None:
+        # Hashed membership; fall back to the sequence for unhashable data.
+        try:
+            items = frozenset(items)
+        except TypeError:
+            pass
         for action in self.actions():
             if action.isCheckable():
                 action.setChecked(action.data() in items)
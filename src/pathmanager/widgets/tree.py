@@ -1,838 +1,1234 @@
-from __future__ import annotations
-
-import dataclasses
-import enum
-from collections.abc import Sequence
-from functools import cache
-from types import SimpleNamespace
-from typing import Any
-
-from qt_material_icons import MaterialIcon
-from qtpy import QtCore, QtGui, QtWidgets
-
-from pathmanager import utils
-from pathmanager.widgets.filter import Filter
-
-StateFlag = QtWidgets.QStyle.StateFlag
-CheckState = QtCore.Qt.CheckState
-ItemDataRole = QtCore.Qt.ItemDataRole
-ItemFlag = QtCore.Qt.ItemFlag
-
-ATTRIBUTE_SEPARATOR = '.'
-
-
-@dataclasses.dataclass
-class Field:
-    name: str
-    label: str = ''
-    editable: bool = False
-    checkable: bool = False
-
-    def __post_init__(self) -> None:
-        if not self.label:
-            self.label = utils.title(self.name)
-
-    def create_item(self, value: Any) -> QtGui.QStandardItem:
-        item = QtGui.QStandardItem()
-        flags = (
-            ItemFlag.ItemIsEnabled
-            | ItemFlag.ItemIsSelectable
-            | ItemFlag.ItemIsDragEnabled
-        )
-        if self.editable:
-            flags |= ItemFlag.ItemIsEditable
-        if self.checkable:
-            flags |= ItemFlag.ItemIsUserCheckable
-            item.setCheckState(CheckState.Unchecked)
-        item.setFlags(flags)
-        item.setData(value, ItemDataRole.DisplayRole)
-        return item
-
-    def refresh(self, value: Any, index: QtCore.QModelIndex) -> None:
-        index.model().setData(index, value, ItemDataRole.DisplayRole)
-
-
-class BoolField(Field):
-    def create_item(self, value: bool) -> QtGui.QStandardItem:
-        item = QtGui.QStandardItem()
-        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
-        if self.editable:
-            item.setFlags(item.flags() or ItemFlag.ItemIsUserCheckable)
-        item.setCheckState(CheckState.Checked if value else CheckState.Unchecked)
-        item.setData(value, ItemDataRole.UserRole)
-        return item
-
-    def refresh(self, value: bool, index: QtCore.QModelIndex) -> None:
-        model = index.model()
-        if isinstance(model, QtGui.QStandardItemModel):
-            item = model.itemFromIndex(index)
-            item.setCheckState(CheckState.Checked if value else CheckState.Unchecked)
-        index.model().setData(index, value, ItemDataRole.UserRole)
-
-
-class EnumField(Field):
-    def create_item(self, value: enum.Enum | None) -> QtGui.QStandardItem:
-        item = QtGui.QStandardItem()
-        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
-        if isinstance(value, enum.Enum):
-            item.setData(value.value, ItemDataRole.DisplayRole)
-        return item
-
-    def refresh(self, value: enum.Enum | None, index: QtCore.QModelIndex) -> None:
-        value = value.value if isinstance(value, enum.Enum) else None
-        index.model().setData(index, value.value, ItemDataRole.DisplayRole)
-
-
-@dataclasses.dataclass
-class ImageField(Field):
-    def create_item(self, value: str) -> QtGui.QStandardItem:
-        item = QtGui.QStandardItem()
-        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
-        if not value:
-            value = get_default_thumbnail()
-        item.setData(value, ItemDataRole.DecorationRole)
-        return item
-
-    def refresh(self, value: str, index: QtCore.QModelIndex) -> None:
-        if not value:
-            value = get_default_thumbnail()
-        index.model().setData(index, value, ItemDataRole.DecorationRole)
-
-
-class ElementModel(QtGui.QStandardItemModel):
-    def __init__(self, parent: QtCore.QObject | None = None) -> None:
-        super().__init__(parent)
-
-        self._group = None
-        self._fields: list[Field] = []
-
-    def clear(self) -> None:
-        super().clear()
-        # NOTE: Clearing the model also clears the headers.
-        self.refresh_header()
-
-    def setData(
-        self,
-        index: QtCore.QModelIndex,
-        value: Any,
-        role: ItemDataRole = ItemDataRole.EditRole,
-    ) -> bool:
-        result = super().setData(index, value, role)
-
-        # Update an element when a user changes the data in the delegate.
-        if role == ItemDataRole.EditRole:
-            if element := self.element(index):
-                field = self._fields[index.column()]
-                value = self.data(index, ItemDataRole.EditRole)
-                set_value(element, field.name, value)
-                self.refresh_index(index)
-
-        return result
-
-    def add_field(self, field: Field) -> None:
-        self._fields.append(field)
-        self.refresh_header()
-
-    def remove_field(self, field: Field) -> None:
-        if field in self._fields:
-            column = self._fields.index(field)
-            self.removeColumn(column)
-            self._fields.remove(field)
-            self.refresh_header()
-
-    def fields(self) -> tuple[Field, ...]:
-        return tuple(self._fields)
-
-    def clear_fields(self) -> None:
-        self._fields = []
-
-    def element(self, index: QtCore.QModelIndex) -> Any:
-        data = self.data(index.siblingAtColumn(0), ItemDataRole.UserRole)
-        return data
-
-    def elements(
-        self, parent: QtCore.QModelIndex | None = None, recursive: bool = True
-    ) -> tuple:
-        """Return all elements of a parent recursively."""
-
-        if parent is None:
-            parent = QtCore.QModelIndex()
-        elements = []
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            if index.isValid():
-                data = index.data(ItemDataRole.UserRole)
-                if data is not None:
-                    elements.append(data)
-                if recursive:
-                    elements.extend(self.elements(index))
-        return tuple(elements)
-
-    def append_element(
-        self,
-        obj: Any,
-        parent: QtCore.QModelIndex | None = None,
-    ) -> QtCore.QModelIndex:
-
-        parent_item = self.itemFromIndex(parent) if parent else None
-        if parent_item is None:
-            parent_item = self.invisibleRootItem()
-
-        items = []
-        for field in self._fields:
-            value = get_value(obj, field.name)
-            item = field.create_item(value)
-            items.append(item)
-
-        if not items:
-            return QtCore.QModelIndex()
-
-        item = items[0]
-        item.setData(obj, ItemDataRole.UserRole)
-        parent_item.appendRow(items)
-        return item.index()
-
-    def remove_element(self, element: Any) -> None:
-        index = self.find_index(element)
-        if not index:
-            return
-
-        # Re-parent child rows
-        item = self.itemFromIndex(index)
-        parent = item.parent()
-        for row in range(item.rowCount()):
-            items = [item.child(row, column) for column in range(item.columnCount())]
-            parent.appendRow(items)
-
-        self.removeRow(index.row())
-
-    def checked_elements(self, parent: QtCore.QModelIndex | None = None) -> tuple:
-        """Return checked elements."""
-
-        if parent is None:
-            parent = QtCore.QModelIndex()
-        elements = []
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            if index.isValid():
-                item = self.itemFromIndex(index)
-                data = index.data(ItemDataRole.UserRole)
-                if (
-                    data is not None
-                    and item.isCheckable()
-                    and item.checkState() == QtCore.Qt.CheckState.Checked
-                ):
-                    elements.append(data)
-                elements.extend(self.elements(index))
-        return tuple(elements)
-
-    def set_checked_elements(
-        self, elements: Sequence, parent: QtCore.QModelIndex | None = None
-    ) -> None:
-        """Set elements to be checked. This does not change other check states."""
-
-        if parent is None:
-            parent = QtCore.QModelIndex()
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            if index.isValid():
-                data = index.data(ItemDataRole.UserRole)
-                item = self.itemFromIndex(index)
-                if data in elements and item.isCheckable():
-                    item.setCheckState(QtCore.Qt.CheckState.Checked)
-                self.set_checked_elements(elements, index)
-
-    def set_all_checked(
-        self, checked: bool = True, parent: QtCore.QModelIndex | None = None
-    ) -> None:
-        """Set all elements to be checked."""
-
-        if checked:
-            state = CheckState.Checked
-        else:
-            state = CheckState.Unchecked
-
-        if parent is None:
-            parent = QtCore.QModelIndex()
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            if index.isValid():
-                item = self.itemFromIndex(index)
-                if item.isCheckable():
-                    item.setCheckState(state)
-                self.set_all_checked(checked, index)
-
-    def get_value(self, index: QtCore.QModelIndex) -> Any:
-        """Return the element's value from an index."""
-
-        element = self.element(index)
-        column = index.column()
-        field = self._fields[column]
-        value = get_value(element, field.name)
-        return value
-
-    def find_index(
-        self,
-        value: Any,
-        role: ItemDataRole = ItemDataRole.UserRole,
-        parent: QtCore.QModelIndex | None = None,
-    ) -> QtCore.QModelIndex:
-        if parent is None:
-            parent = QtCore.QModelIndex()
-        index = QtCore.QModelIndex()
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            if not index.isValid():
-                continue
-            if value == self.data(index, role):
-                break
-            index = self.find_index(value, role, index)
-            if index.isValid():
-                break
-        return index
-
-    def refresh_index(self, index: QtCore.QModelIndex) -> None:
-        """Refresh the DisplayRole of all items in the index's row."""
-
-        element = self.element(index)
-        for column, field in enumerate(self._fields):
-            item_index = index.siblingAtColumn(column)
-            value = get_value(element, field.name)
-            field.refresh(value, item_index)
-
-    def refresh_element(self, element: Any) -> None:
-        """Refresh the DisplayRole of all items in the element's row."""
-
-        index = self.find_index(element)
-        if index.isValid():
-            self.refresh_index(index)
-
-    def refresh_column(
-        self, column: int, parent: QtCore.QModelIndex | None = None
-    ) -> None:
-        """Refresh the DisplayRole of all items in the column."""
-
-        if parent is None:
-            parent = QtCore.QModelIndex()
-
-        field = self._fields[column]
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, column, parent)
-            if not index.isValid():
-                continue
-            element = self.element(index)
-            if element:
-                value = get_value(element, field.name)
-                field.refresh(value, index)
-            self.refresh_column(column, parent=index)
-
-    def refresh_header(self) -> None:
-        labels = [field.label for field in self._fields]
-        self.setHorizontalHeaderLabels(labels)
-
-
-class ProxyModel(QtCore.QSortFilterProxyModel):
-    """
-    QSortFilterProxyModel with 'autoAcceptChildRows' that has been added in Qt6.
-    """
-
-    _autoAcceptChildRows = False
-
-    def autoAcceptChildRows(self) -> bool:  # noqa
-        return self._autoAcceptChildRows
-
-    def setAutoAcceptChildRows(self, value: bool):  # noqa
-        self._autoAcceptChildRows = value
-
-    def filterAcceptsRow(
-        self, source_row: int, source_parent: QtCore.QModelIndex
-    ) -> bool:
-        if super().filterAcceptsRow(source_row, source_parent):
-            return True
-        if self.autoAcceptChildRows() and source_parent.isValid():
-            source_row = source_parent.row()
-            source_parent = source_parent.parent()
-            return self.filterAcceptsRow(source_row, source_parent)
-        return False
-
-
-class FilterProxyModel(ProxyModel):
-    class AcceptRule(enum.Enum):
-        DEFAULT = None
-        ALLOW_ALL = 1
-        ALLOW_NONE = 2
-
-    def __init__(self, parent: QtCore.QObject | None = None) -> None:
-        super().__init__(parent)
-        self.setFilterCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
-
-        self._filters: dict[int, Filter] = {}
-        self._sort_roles: dict[int, ItemDataRole] = {}
-        self._accept_rule = FilterProxyModel.AcceptRule.DEFAULT
-
-    def filterAcceptsRow(
-        self, source_row: int, source_parent: QtCore.QModelIndex
-    ) -> bool:
-        if self._accept_rule == FilterProxyModel.AcceptRule.DEFAULT:
-            pass
-        elif self._accept_rule == FilterProxyModel.AcceptRule.ALLOW_ALL:
-            return True
-        elif self._accept_rule == FilterProxyModel.AcceptRule.ALLOW_NONE:
-            return False
-
-        if not super().filterAcceptsRow(source_row, source_parent):
-            return False
-
-        for column, field_filter in self._filters.items():
-            if field_filter.match:
-                index = self.sourceModel().index(source_row, column, source_parent)
-                value = index.data(field_filter.role)
-                if not field_filter.accepts(value):
-                    return False
-        return True
-
-    def lessThan(
-        self, source_left: QtCore.QModelIndex, source_right: QtCore.QModelIndex
-    ) -> bool:
-        # NOTE: The default implementation only handles built-in types.
-        left = source_left.data(self.sort_role(source_left.column()))
-        right = source_right.data(self.sort_role(source_right.column()))
-        try:
-            return (left is None, left) < (right is None, right)
-        except TypeError:
-            return True
-
-    def accept_rule(self) -> FilterProxyModel.AcceptRule:
-        return self._accept_rule
-
-    def set_accept_rule(self, accept_rule: FilterProxyModel.AcceptRule) -> None:
-        if accept_rule != self._accept_rule:
-            self._accept_rule = accept_rule
-            self.invalidateFilter()
-
-    def filter(self, column: int) -> Filter | None:
-        return self._filters.get(column)
-
-    def set_filter(self, column: int, filter_: Filter) -> None:
-        self._filters[column] = filter_
-
-    def set_filters(self, filters: dict) -> None:
-        self._filters = filters
-
-    def remove_filter(self, column: int) -> None:
-        if column in self._filters:
-            del self._filters[column]
-
-    def sort_role(self, column: int) -> int:
-        role = self._sort_roles.get(column, ItemDataRole.DisplayRole)
-        return role
-
-    def set_sort_role(self, column: int, role: ItemDataRole) -> None:
-        self._sort_roles[column] = role
-
-
-class StyledItemDelegate(QtWidgets.QStyledItemDelegate):
-    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
-        super().__init__(parent)
-
-        self._padding = QtCore.QSize(0, 4)
-
-    def sizeHint(
-        self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex
-    ) -> QtCore.QSize:
-        size_hint = super().sizeHint(option, index)
-        size_hint += self._padding
-        return size_hint
-
-    def setModelData(
-        self,
-        editor: QtWidgets.QWidget,
-        model: QtCore.QAbstractItemModel,
-        index: QtCore.QModelIndex,
-        value: Any = None,
-    ) -> None:
-        """Set data on all selected rows."""
-
-        # Include the current index, in case it is not selected.
-        indexes = {index}
-        parent = self.parent()
-        if isinstance(parent, QtWidgets.QTreeView):
-            selection_model = parent.selectionModel()
-            indexes.update(selection_model.selectedRows(index.column()))
-
-        for i in indexes:
-            if value is None:
-                super().setModelData(editor, model, i)
-            else:
-                model.setData(i, value, QtCore.Qt.ItemDataRole.EditRole)
-
-    def updateEditorGeometry(
-        self,
-        editor: QtWidgets.QWidget,
-        option: QtWidgets.QStyleOption,
-        index: QtCore.QModelIndex,
-    ) -> None:
-        editor.setGeometry(option.rect)
-
-    def padding(self) -> QtCore.QSize:
-        return self._padding
-
-    def set_padding(self, padding: QtCore.QSize) -> None:
-        self._padding = padding
-
-
-class ImageDelegate(QtWidgets.QStyledItemDelegate):
-    """Delegate to display image thumbnails."""
-
-    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
-        super().__init__(parent)
-        self._aspect_ratio = 16 / 9
-        self._max_width = 192
-        self._width = 64
-        self._size = self._get_size()
-
-    def paint(
-        self,
-        painter: QtGui.QPainter,
-        option: QtWidgets.QStyleOptionViewItem,
-        index: QtCore.QModelIndex,
-    ) -> None:
-        widget = self.parent()
-        if not isinstance(widget, QtWidgets.QWidget):
-            return
-
-        style = widget.style()
-        self.initStyleOption(option, index)
-        painter.save()
-        painter.setClipRect(option.rect)
-
-        # Panel
-        style.drawPrimitive(
-            QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem,
-            option,
-            painter,
-            widget,
-        )
-
-        # Pixmap
-        pixmap_rect = QtCore.QRect(option.rect)
-        pixmap_rect.setSize(self._size)
-        mode = QtGui.QIcon.Mode.Normal
-        if not option.state & StateFlag.State_Enabled:
-            mode = QtGui.QIcon.Mode.Disabled
-        elif option.state & StateFlag.State_Selected:
-            mode = QtGui.QIcon.Mode.Selected
-
-        if option.state & StateFlag.State_Open == StateFlag.State_Open:
-            state = QtGui.QIcon.State.On
-        else:
-            state = QtGui.QIcon.State.Off
-        option.icon.paint(painter, pixmap_rect, option.decorationAlignment, mode, state)
-
-        # Focus Rect
-        if option.state & StateFlag.State_HasFocus:
-            option_focus = QtWidgets.QStyleOptionFocusRect()
-            option_focus.rect = option.rect
-            option_focus.state = option.state
-            option_focus.state |= StateFlag.State_KeyboardFocusChange
-            option_focus.state |= StateFlag.State_Item
-
-            if option.state & StateFlag.State_Enabled:
-                color_group = QtGui.QPalette.ColorGroup.Normal
-            else:
-                color_group = QtGui.QPalette.ColorGroup.Disabled
-
-            if option.state & StateFlag.State_Selected:
-                role = QtGui.QPalette.ColorRole.Highlight
-            else:
-                role = QtGui.QPalette.ColorRole.Window
-            option_focus.backgroundColor = option.palette.color(color_group, role)
-            style.drawPrimitive(
-                QtWidgets.QStyle.PrimitiveElement.PE_FrameFocusRect,
-                option_focus,
-                painter,
-                widget,
-            )
-
-        painter.restore()
-
-    def sizeHint(
-        self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex
-    ) -> QtCore.QSize:
-        return self._size
-
-    def aspect_ratio(self) -> float:
-        return self._aspect_ratio
-
-    def set_aspect_ratio(self, aspect_ratio: float) -> None:
-        self._aspect_ratio = aspect_ratio
-        self._size = self._get_size()
-
-    def max_width(self) -> int:
-        return self._max_width
-
-    def set_max_width(self, max_width: int) -> None:
-        self._max_width = max_width
-        self._size = self._get_size()
-
-    def width(self) -> int:
-        return self._width
-
-    def set_width(self, width: int) -> None:
-        self._width = min(width, self._max_width)
-        self._size = self._get_size()
-
-    def _get_size(self) -> QtCore.QSize:
-        return QtCore.QSize(self._width, int(self._width / self._aspect_ratio))
-
-
-class DateDelegate(StyledItemDelegate):
-    def displayText(self, value: QtCore.QDateTime, locale: QtCore.QLocale) -> str:
-        return value.toLocalTime().toString()
-
-
-class MaterialStyle(QtWidgets.QProxyStyle):
-    def drawControl(
-        self,
-        element: QtWidgets.QStyle.ControlElement,
-        option: QtWidgets.QStyleOption,
-        painter: QtGui.QPainter,
-        widget: QtWidgets.QWidget | None = None,
-    ) -> None:
-        if element == QtWidgets.QStyle.ControlElement.CE_HeaderSection:
-            frame_option = QtWidgets.QStyleOptionFrame()
-            frame_option.rect = option.rect
-            frame_option.frameShape = QtWidgets.QFrame.Shape.StyledPanel
-            element = QtWidgets.QStyle.ControlElement.CE_ShapedFrame
-            super().drawControl(element, frame_option, painter, widget)
-            return
-        elif element == QtWidgets.QStyle.ControlElement.CE_HeaderLabel:
-            option.rect.adjust(8, 0, -8, 0)
-        super().drawControl(element, option, painter, widget)
-
-
-class ElementTree(QtWidgets.QTreeView):
-    selection_changed = QtCore.Signal()
-    # The checked_changed Signal is disabled by default.
-    # Set enable_checked_signal = True to enable it.
-    checked_changed = QtCore.Signal()
-
-    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
-        super().__init__(parent)
-
-        self._checked = set()
-
-        # Initialize QTreeView
-        mode = QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection
-        self.setSelectionMode(mode)
-        behavior = QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
-        self.setSelectionBehavior(behavior)
-        self.setSortingEnabled(True)
-
-        # Parent the delegate to enable setModelData on selection
-        delegate = StyledItemDelegate(parent=self)
-        self.setItemDelegate(delegate)
-
-        # Initialize Header
-        header = self.header()
-        header.setMinimumHeight(32)
-        header.setTextElideMode(QtCore.Qt.TextElideMode.ElideRight)
-        header.setStretchLastSection(True)
-        header.sectionResized.connect(self._header_resized)
-
-        # Only check when enabled for optimization
-        self.enable_checked_signal = False
-
-        # self.proxy_style = MaterialStyle(header.style().objectName())
-        # self.proxy_style.setParent(header)
-        # header.setStyle(self.proxy_style)
-
-    def dataChanged(
-        self,
-        top_left: QtCore.QModelIndex,
-        bottom_right: QtCore.QModelIndex,
-        roles: Sequence[QtCore.Qt.ItemDataRole] = (),
-    ) -> None:
-        is_checked_role = QtCore.Qt.ItemDataRole.CheckStateRole in roles
-        if self.enable_checked_signal and is_checked_role:
-            checked_indexes = tuple(item.index() for item in self.checked_items())
-            checked = set(checked_indexes)
-            try:
-                changed = self._checked != checked
-            except RuntimeError:
-                # In case the items no longer exist in the model
-                changed = True
-
-            if changed:
-                self._checked = checked
-                self.checked_changed.emit()
-        super().dataChanged(top_left, bottom_right, roles)
-
-    def expandToDepth(self, depth: int) -> None:
-        """
-        Expand items up to a depth. If the depth is negative, expand relative to the
-        leaf node.
-        """
-
-        # HACK: The built-in method does not seem to work. Maybe the ProxyModels?
-
-        if depth > 0:
-            self._expand_to_depth(depth, current_depth=0)
-        elif depth < 0:
-            self.expandAll()
-            self._collapse_to_depth(depth)
-        else:
-            self.expandAll()
-
-    def _expand_to_depth(
-        self,
-        depth: int,
-        index: QtCore.QModelIndex | None = None,
-        current_depth: int = 0,
-    ) -> None:
-        """Expand the index if the current_depth is above the detph."""
-
-        if index is None:
-            index = QtCore.QModelIndex()
-        if current_depth > depth:
-            return
-        if index.isValid():
-            self.expand(index)
-
-        model = self.model()
-        for row in range(model.rowCount(index)):
-            child = model.index(row, 0, index)
-            if child.isValid():
-                self._expand_to_depth(
-                    depth, index=child, current_depth=current_depth + 1
-                )
-
-    def _collapse_to_depth(
-        self, depth: int, index: QtCore.QModelIndex | None = None
-    ) -> int:
-        """Return the depth of the index and collapse it if it is above the depth."""
-
-        if index is None:
-            index = QtCore.QModelIndex()
-        current_depth = -1
-
-        model = self.model()
-        for row in range(model.rowCount(index)):
-            child = model.index(row, 0, index)
-            if child.isValid():
-                child_depth = self._collapse_to_depth(depth, index=child)
-                current_depth = min(current_depth, child_depth - 1)
-
-        if current_depth >= depth and index.isValid():
-            self.collapse(index)
-
-        return current_depth
-
-    def selectionChanged(
-        self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection
-    ) -> None:
-        self.selection_changed.emit()
-        super().selectionChanged(selected, deselected)
-
-    def checked_items(
-        self, parent: QtCore.QModelIndex | None = None
-    ) -> tuple[QtGui.QStandardItem, ...]:
-        """Return checked QStandardItems from the list."""
-
-        items = []
-
-        if parent is None:
-            parent = QtCore.QModelIndex()
-
-        model = self.model()
-        if isinstance(model, QtCore.QSortFilterProxyModel):
-            model = model.sourceModel()
-        if isinstance(model, QtGui.QStandardItemModel):
-            for row in range(model.rowCount(parent=parent)):
-                index = model.index(row, 0, parent)
-                if index.isValid():
-                    items.extend(self.checked_items(parent=index))
-                    item = model.itemFromIndex(index)
-                    if item and item.checkState() == QtCore.Qt.CheckState.Checked:
-                        items.append(item)
-        return tuple(items)
-
-    def resize_columns(self, padding: int = 8) -> None:
-        """Resize columns with horizontal padding taking all rows into account."""
-
-        model = self.model()
-        if model and model.rowCount():
-            self.expandAll()
-            for column in range(model.columnCount()):
-                # Using sizeHint keeps the last column narrow
-                width = self.header().sectionSizeHint(column)
-                width = max(width, self.sizeHintForColumn(column))
-                width += padding
-                self.setColumnWidth(column, width)
-            self.collapseAll()
-
-    def _header_resized(self, column: int, old: int, new: int) -> None:
-        """Resize ImageDelegates when the header resized."""
-
-        delegate = self.itemDelegateForColumn(column)
-        if isinstance(delegate, ImageDelegate):
-            delegate.set_width(new)
-            if new < delegate.max_width():
-                for row in range(self.model().rowCount()):
-                    index = self.model().index(row, column)
-                    delegate.sizeHintChanged.emit(index)
-
-
-def get_value(obj: Any, name: str) -> Any:
-    """
-    Return the value from an object's attribute. Attribute name can be separated by
-    a dot.
-    """
-
-    attributes = name.split(ATTRIBUTE_SEPARATOR) if name else ()
-    value = obj
-    for attribute in attributes:
-        value = getattr(value, attribute, None)
-    return value
-
-
-def set_value(obj: Any, name: str, value: Any) -> None:
-    """Set the attribute on an object, creating an object structure if needed."""
-
-    if obj is None:
-        return
-
-    attributes = name.split(ATTRIBUTE_SEPARATOR)
-    for attribute in attributes[:-1]:
-        child = getattr(obj, attribute, None)
-        if child is None:
-            namespace = SimpleNamespace()
-            setattr(obj, attribute, namespace)
-            child = namespace
-        obj = child
-    setattr(obj, attributes[-1], value)
-
-
-@cache
-def get_default_thumbnail() -> QtGui.QPixmap:
-    size = QtCore.QSize(192, 108)
-    icon_size = QtCore.QSize(48, 48)
-
-    pixmap = QtGui.QPixmap(size)
-    palette = QtWidgets.QApplication.palette()
-    color = palette.color(
-        QtGui.QPalette.ColorGroup.Normal, QtGui.QPalette.ColorRole.Shadow
-    )
-    pixmap.fill(color)
-
-    icon = MaterialIcon('image')
-    icon_pixmap = icon.pixmap(size=icon_size, mode=QtGui.QIcon.Mode.Disabled)
-
-    x = (size.width() - icon_size.width()) // 2
-    y = (size.height() - icon_size.height()) // 2
-    origin = QtCore.QPoint(x, y)
-
-    painter = QtGui.QPainter(pixmap)
-    painter.drawPixmap(origin, icon_pixmap)
-    painter.end()
-    return pixmap
+from __future__ import annotations
+
+import dataclasses
+import enum
+from collections import deque
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any
+
+from qt_material_icons import MaterialIcon
+from qtpy import QtCore, QtGui, QtWidgets
+
+from pathmanager import utils
+from pathmanager.widgets.filter import Filter
+
+StateFlag = QtWidgets.QStyle.StateFlag
+CheckState = QtCore.Qt.CheckState
+ItemDataRole = QtCore.Qt.ItemDataRole
+ItemFlag = QtCore.Qt.ItemFlag
+
+ATTRIBUTE_SEPARATOR = '.'
+
+
+@dataclasses.dataclass
+class Field:
+    name: str
+    label: str = ''
+    editable: bool = False
+    checkable: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.label:
+            self.label = utils.title(self.name)
+        # Pre-split the attribute path; cell refreshes resolve it per row.
+        self._path = tuple(self.name.split(ATTRIBUTE_SEPARATOR)) if self.name else ()
+
+    def value(self, obj: Any) -> Any:
+        """Return the field's value from an object."""
+
+        for attribute in self._path:
+            obj = getattr(obj, attribute, None)
+        return obj
+
+    def create_item(self, value: Any) -> QtGui.QStandardItem:
+        item = QtGui.QStandardItem()
+        flags = (
+            ItemFlag.ItemIsEnabled
+            | ItemFlag.ItemIsSelectable
+            | ItemFlag.ItemIsDragEnabled
+        )
+        if self.editable:
+            flags |= ItemFlag.ItemIsEditable
+        if self.checkable:
+            flags |= ItemFlag.ItemIsUserCheckable
+            item.setCheckState(CheckState.Unchecked)
+        item.setFlags(flags)
+        item.setData(value, ItemDataRole.DisplayRole)
+        return item
+
+    def refresh(
+        self,
+        value: Any,
+        index: QtCore.QModelIndex,
+        model: QtCore.QAbstractItemModel | None = None,
+    ) -> None:
+        # The model is threaded through by ElementModel to skip the
+        # index.model() virtual call per cell.
+        model = model or index.model()
+        model.setData(index, value, ItemDataRole.DisplayRole)
+
+
+class BoolField(Field):
+    def create_item(self, value: bool) -> QtGui.QStandardItem:
+        item = QtGui.QStandardItem()
+        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
+        if self.editable:
+            item.setFlags(item.flags() or ItemFlag.ItemIsUserCheckable)
+        item.setCheckState(CheckState.Checked if value else CheckState.Unchecked)
+        item.setData(value, ItemDataRole.UserRole)
+        return item
+
+    def refresh(
+        self,
+        value: bool,
+        index: QtCore.QModelIndex,
+        model: QtCore.QAbstractItemModel | None = None,
+    ) -> None:
+        model = model or index.model()
+        state = CheckState.Checked if value else CheckState.Unchecked
+        if isinstance(model, QtGui.QStandardItemModel):
+            # Combine the check state and data updates into one notification.
+            item = model.itemFromIndex(index)
+            blocked = model.blockSignals(True)
+            item.setCheckState(state)
+            item.setData(value, ItemDataRole.UserRole)
+            model.blockSignals(blocked)
+            if not blocked:
+                roles = [ItemDataRole.CheckStateRole, ItemDataRole.UserRole]
+                model.dataChanged.emit(index, index, roles)
+        else:
+            model.setData(index, state, ItemDataRole.CheckStateRole)
+            model.setData(index, value, ItemDataRole.UserRole)
+
+
+class EnumField(Field):
+    def create_item(self, value: enum.Enum | None) -> QtGui.QStandardItem:
+        item = QtGui.QStandardItem()
+        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
+        if isinstance(value, enum.Enum):
+            item.setData(value.value, ItemDataRole.DisplayRole)
+        return item
+
+    def refresh(
+        self,
+        value: enum.Enum | None,
+        index: QtCore.QModelIndex,
+        model: QtCore.QAbstractItemModel | None = None,
+    ) -> None:
+        value = value.value if isinstance(value, enum.Enum) else None
+        model = model or index.model()
+        model.setData(index, value, ItemDataRole.DisplayRole)
+
+
+@dataclasses.dataclass
+class ImageField(Field):
+    def create_item(self, value: str) -> QtGui.QStandardItem:
+        item = QtGui.QStandardItem()
+        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
+        if not value:
+            value = get_default_thumbnail()
+        item.setData(value, ItemDataRole.DecorationRole)
+        return item
+
+    def refresh(
+        self,
+        value: str,
+        index: QtCore.QModelIndex,
+        model: QtCore.QAbstractItemModel | None = None,
+    ) -> None:
+        if not value:
+            value = get_default_thumbnail()
+        model = model or index.model()
+        model.setData(index, value, ItemDataRole.DecorationRole)
+
+
+class ElementModel(QtGui.QStandardItemModel):
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+
+        self._group = None
+        self._fields: list[Field] = []
+        self._placeholder_brush: QtGui.QBrush | None = None
+        self._has_editable = False
+        # Element lookups; find_index walked the whole tree per call. The
+        # map is built lazily on the first lookup so bulk loads don't pay
+        # Qt's persistent-index upkeep on every insert.
+        self._index_by_element: dict[int, QtCore.QPersistentModelIndex] = {}
+
+    def clear(self) -> None:
+        self._index_by_element.clear()
+        super().clear()
+        # NOTE: Clearing the model also clears the headers.
+        self.refresh_header()
+
+    def data(
+        self,
+        index: QtCore.QModelIndex,
+        role: ItemDataRole = ItemDataRole.DisplayRole,
+    ) -> Any:
+        # Color editable items lazily as the view paints them instead of
+        # refreshing the foreground of every item after each rebuild.
+        # Read-only models skip the flags lookup entirely.
+        if (
+            role == ItemDataRole.ForegroundRole
+            and self._has_editable
+            and self._placeholder_brush is not None
+        ):
+            if self.flags(index) & ItemFlag.ItemIsEditable:
+                return self._placeholder_brush
+        return super().data(index, role)
+
+    def setData(
+        self,
+        index: QtCore.QModelIndex,
+        value: Any,
+        role: ItemDataRole = ItemDataRole.EditRole,
+    ) -> bool:
+        result = super().setData(index, value, role)
+
+        # Update an element when a user changes the data in the delegate.
+        if role == ItemDataRole.EditRole:
+            if element := self.element(index):
+                field = self._fields[index.column()]
+                value = self.data(index, ItemDataRole.EditRole)
+                set_value(element, field.name, value)
+                self.refresh_index(index)
+
+        return result
+
+    def add_field(self, field: Field) -> None:
+        self._fields.append(field)
+        self._has_editable = self._has_editable or field.editable
+        self.refresh_header()
+
+    def remove_field(self, field: Field) -> None:
+        if field in self._fields:
+            column = self._fields.index(field)
+            self.removeColumn(column)
+            self._fields.remove(field)
+            self._has_editable = any(f.editable for f in self._fields)
+            self.refresh_header()
+
+    def placeholder_brush(self) -> QtGui.QBrush | None:
+        return self._placeholder_brush
+
+    def set_placeholder_brush(self, brush: QtGui.QBrush | None) -> None:
+        """Set the foreground brush used for editable items."""
+
+        self._placeholder_brush = brush
+
+    def fields(self) -> tuple[Field, ...]:
+        return tuple(self._fields)
+
+    def clear_fields(self) -> None:
+        self._fields = []
+        self._has_editable = False
+
+    def element(self, index: QtCore.QModelIndex) -> Any:
+        data = self.data(index.siblingAtColumn(0), ItemDataRole.UserRole)
+        return data
+
+    def elements(
+        self, parent: QtCore.QModelIndex | None = None, recursive: bool = True
+    ) -> tuple:
+        """Return all elements of a parent recursively."""
+
+        if parent is None:
+            parent = QtCore.QModelIndex()
+
+        model_index = self.index
+        row_count = self.rowCount
+
+        elements = []
+        append = elements.append
+        stack = deque(
+            model_index(row, 0, parent) for row in reversed(range(row_count(parent)))
+        )
+        while stack:
+            index = stack.pop()
+            if not index.isValid():
+                continue
+            if (data := index.data(ItemDataRole.UserRole)) is not None:
+                append(data)
+            if recursive:
+                stack.extend(
+                    model_index(row, 0, index)
+                    for row in reversed(range(row_count(index)))
+                )
+        return tuple(elements)
+
+    def append_element(
+        self,
+        obj: Any,
+        parent: QtCore.QModelIndex | None = None,
+    ) -> QtCore.QModelIndex:
+
+        parent_item = self.itemFromIndex(parent) if parent else None
+        if parent_item is None:
+            parent_item = self.invisibleRootItem()
+
+        items = [field.create_item(field.value(obj)) for field in self._fields]
+
+        if not items:
+            return QtCore.QModelIndex()
+
+        item = items[0]
+        item.setData(obj, ItemDataRole.UserRole)
+        parent_item.appendRow(items)
+        return item.index()
+
+    def append_elements(
+        self,
+        objs: Sequence[Any],
+        parent: QtCore.QModelIndex | None = None,
+    ) -> None:
+        """
+        Append multiple elements, notifying the views once.
+        Attached views process a single reset instead of one insert per row.
+        """
+
+        blocked = self.blockSignals(True)
+        for obj in objs:
+            self.append_element(obj, parent)
+        self.blockSignals(blocked)
+        if not blocked:
+            self.beginResetModel()
+            self.endResetModel()
+
+    def remove_element(self, element: Any) -> None:
+        index = self.find_index(element)
+        if not index.isValid():
+            return
+
+        item = self.itemFromIndex(index)
+        parent = item.parent() or self.invisibleRootItem()
+
+        # Re-parent child rows as whole-row takes with signals blocked; each
+        # child/appendRow pair signalled the views per cell.
+        blocked = self.blockSignals(True)
+        rows = []
+        while item.rowCount():
+            rows.append(item.takeRow(0))
+        self.removeRow(index.row(), index.parent())
+        for row in rows:
+            parent.appendRow(row)
+        # The moved rows invalidate their registered indexes; drop the map
+        # so the next lookup rebuilds it.
+        self._index_by_element.clear()
+        self.blockSignals(blocked)
+        if not blocked:
+            self.beginResetModel()
+            self.endResetModel()
+
+    def checked_elements(self, parent: QtCore.QModelIndex | None = None) -> tuple:
+        """Return checked elements."""
+
+        if parent is None:
+            parent = QtCore.QModelIndex()
+
+        checked = QtCore.Qt.CheckState.Checked
+        elements = []
+        append = elements.append
+        stack = deque(
+            self.index(row, 0, parent) for row in reversed(range(self.rowCount(parent)))
+        )
+        while stack:
+            index = stack.pop()
+            if not index.isValid():
+                continue
+            item = self.itemFromIndex(index)
+            data = index.data(ItemDataRole.UserRole)
+            if data is not None and item.isCheckable() and item.checkState() == checked:
+                append(data)
+            stack.extend(
+                self.index(row, 0, index)
+                for row in reversed(range(self.rowCount(index)))
+            )
+        return tuple(elements)
+
+    def set_checked_elements(
+        self, elements: Sequence, parent: QtCore.QModelIndex | None = None
+    ) -> None:
+        """Set elements to be checked. This does not change other check states."""
+
+        if parent is None:
+            parent = QtCore.QModelIndex()
+
+        # Membership by identity; elements aren't guaranteed hashable.
+        wanted = {id(element) for element in elements}
+        stack = deque((parent,))
+        while stack:
+            parent = stack.pop()
+            for row in range(self.rowCount(parent)):
+                index = self.index(row, 0, parent)
+                if not index.isValid():
+                    continue
+                data = index.data(ItemDataRole.UserRole)
+                if id(data) in wanted:
+                    item = self.itemFromIndex(index)
+                    if item.isCheckable():
+                        item.setCheckState(QtCore.Qt.CheckState.Checked)
+                stack.append(index)
+
+    def set_all_checked(
+        self, checked: bool = True, parent: QtCore.QModelIndex | None = None
+    ) -> None:
+        """Set all elements to be checked."""
+
+        if checked:
+            state = CheckState.Checked
+        else:
+            state = CheckState.Unchecked
+
+        if parent is None:
+            parent = QtCore.QModelIndex()
+
+        # Set the states with signals blocked and notify with one ranged
+        # dataChanged per parent; every setCheckState signalled the views.
+        blocked = self.blockSignals(True)
+        ranges = []
+        try:
+            stack = deque((parent,))
+            while stack:
+                parent = stack.pop()
+                rows = self.rowCount(parent)
+                if rows:
+                    ranges.append((parent, rows))
+                for row in range(rows):
+                    index = self.index(row, 0, parent)
+                    if not index.isValid():
+                        continue
+                    item = self.itemFromIndex(index)
+                    if item.isCheckable():
+                        item.setCheckState(state)
+                    stack.append(index)
+        finally:
+            self.blockSignals(blocked)
+
+        if not blocked:
+            roles = [ItemDataRole.CheckStateRole]
+            for parent, rows in ranges:
+                top = self.index(0, 0, parent)
+                bottom = self.index(rows - 1, 0, parent)
+                self.dataChanged.emit(top, bottom, roles)
+
+    def get_value(self, index: QtCore.QModelIndex) -> Any:
+        """Return the element's value from an index."""
+
+        element = self.element(index)
+        field = self._fields[index.column()]
+        return field.value(element)
+
+    def find_index(
+        self,
+        value: Any,
+        role: ItemDataRole = ItemDataRole.UserRole,
+        parent: QtCore.QModelIndex | None = None,
+    ) -> QtCore.QModelIndex:
+        # Elements are indexed on insert, so the common lookup is O(1). A
+        # model reset invalidates the registered indexes; rebuild the map
+        # with a single walk on the first miss afterwards.
+        if role == ItemDataRole.UserRole and parent is None:
+            persistent = self._index_by_element.get(id(value))
+            if persistent is None or not persistent.isValid():
+                self._rebuild_element_index()
+                persistent = self._index_by_element.get(id(value))
+            if persistent is not None and persistent.isValid():
+                return QtCore.QModelIndex(persistent)
+            return QtCore.QModelIndex()
+
+        if parent is None:
+            parent = QtCore.QModelIndex()
+        index = QtCore.QModelIndex()
+        for row in range(self.rowCount(parent)):
+            index = self.index(row, 0, parent)
+            if not index.isValid():
+                continue
+            if value == self.data(index, role):
+                break
+            index = self.find_index(value, role, index)
+            if index.isValid():
+                break
+        return index
+
+    def _rebuild_element_index(self) -> None:
+        """Re-register every element with a single model walk."""
+
+        index_by_element = {}
+        stack = [QtCore.QModelIndex()]
+        while stack:
+            parent = stack.pop()
+            for row in range(self.rowCount(parent)):
+                index = self.index(row, 0, parent)
+                if not index.isValid():
+                    continue
+                if (data := self.data(index, ItemDataRole.UserRole)) is not None:
+                    index_by_element[id(data)] = QtCore.QPersistentModelIndex(index)
+                stack.append(index)
+        self._index_by_element = index_by_element
+
+    def refresh_index(self, index: QtCore.QModelIndex) -> None:
+        """Refresh the DisplayRole of all items in the index's row."""
+
+        element = self.element(index)
+        row = index.row()
+        parent = index.parent()
+        for column, field in enumerate(self._fields):
+            item_index = self.index(row, column, parent)
+            field.refresh(field.value(element), item_index, self)
+
+    def refresh_element(self, element: Any) -> None:
+        """Refresh the DisplayRole of all items in the element's row."""
+
+        index = self.find_index(element)
+        if index.isValid():
+            self.refresh_index(index)
+
+    def refresh_column(
+        self, column: int, parent: QtCore.QModelIndex | None = None
+    ) -> None:
+        """Refresh the DisplayRole of all items in the column."""
+
+        if parent is None:
+            parent = QtCore.QModelIndex()
+
+        field = self._fields[column]
+
+        # Push the values with model signals blocked and notify with one
+        # ranged dataChanged per parent instead of one signal per cell.
+        blocked = self.blockSignals(True)
+        ranges = []
+        try:
+            stack = [parent]
+            while stack:
+                p = stack.pop()
+                rows = self.rowCount(p)
+                if not rows:
+                    continue
+                ranges.append((p, rows))
+                for row in range(rows):
+                    index = self.index(row, column, p)
+                    if index.isValid():
+                        element = self.element(index)
+                        if element:
+                            field.refresh(field.value(element), index, self)
+                    # NOTE: Children hang off column 0.
+                    stack.append(self.index(row, 0, p))
+        finally:
+            self.blockSignals(blocked)
+
+        if not blocked:
+            for p, rows in ranges:
+                top = self.index(0, column, p)
+                bottom = self.index(rows - 1, column, p)
+                self.dataChanged.emit(top, bottom)
+
+    def refresh_header(self) -> None:
+        labels = [field.label for field in self._fields]
+        self.setHorizontalHeaderLabels(labels)
+
+
+class ProxyModel(QtCore.QSortFilterProxyModel):
+    """
+    QSortFilterProxyModel with 'autoAcceptChildRows' that has been added in Qt6.
+    """
+
+    _autoAcceptChildRows = False
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+
+        # Ancestry acceptance cache; rejected rows re-walk their parent
+        # chain when autoAcceptChildRows is set, which is quadratic in depth.
+        self._accept_cache: dict[tuple, bool] = {}
+
+    def setSourceModel(self, model: QtCore.QAbstractItemModel) -> None:
+        super().setSourceModel(model)
+        self._accept_cache.clear()
+        model.dataChanged.connect(self._clear_accept_cache)
+        model.rowsInserted.connect(self._clear_accept_cache)
+        model.rowsRemoved.connect(self._clear_accept_cache)
+        model.modelReset.connect(self._clear_accept_cache)
+
+    def invalidateFilter(self) -> None:
+        self._accept_cache.clear()
+        super().invalidateFilter()
+
+    def setFilterRegularExpression(self, pattern) -> None:
+        self._accept_cache.clear()
+        super().setFilterRegularExpression(pattern)
+
+    def setFilterWildcard(self, pattern: str) -> None:
+        self._accept_cache.clear()
+        super().setFilterWildcard(pattern)
+
+    def setFilterFixedString(self, pattern: str) -> None:
+        self._accept_cache.clear()
+        super().setFilterFixedString(pattern)
+
+    def _clear_accept_cache(self) -> None:
+        if self._accept_cache:
+            self._accept_cache.clear()
+
+    def autoAcceptChildRows(self) -> bool:  # noqa
+        return self._autoAcceptChildRows
+
+    def setAutoAcceptChildRows(self, value: bool):  # noqa
+        self._autoAcceptChildRows = value
+
+    def filterAcceptsRow(
+        self, source_row: int, source_parent: QtCore.QModelIndex
+    ) -> bool:
+        if super().filterAcceptsRow(source_row, source_parent):
+            return True
+        if self.autoAcceptChildRows() and source_parent.isValid():
+            key = (source_parent.internalId(), source_parent.row())
+            cached = self._accept_cache.get(key)
+            if cached is None:
+                cached = self.filterAcceptsRow(
+                    source_parent.row(), source_parent.parent()
+                )
+                self._accept_cache[key] = cached
+            return cached
+        return False
+
+
+class FilterProxyModel(ProxyModel):
+    class AcceptRule(enum.Enum):
+        DEFAULT = None
+        ALLOW_ALL = 1
+        ALLOW_NONE = 2
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+
+        self._filters: dict[int, Filter] = {}
+        self._sort_roles: dict[int, ItemDataRole] = {}
+        self._sort_keys: dict[int, Callable] = {}
+        self._accept_rule = FilterProxyModel.AcceptRule.DEFAULT
+        self._active_filters: tuple = ()
+        self._source: QtCore.QAbstractItemModel | None = None
+        self._fast_path = True
+
+    def setSourceModel(self, model: QtCore.QAbstractItemModel) -> None:
+        super().setSourceModel(model)
+        self._source = model
+
+    def _refresh_filters(self) -> None:
+        """Snapshot the filters; accepts runs once per row per column."""
+
+        # accepts() reads the live predicate, so the snapshot stays correct
+        # when a widget mutates its filter in place.
+        self._active_filters = tuple(
+            (column, field_filter.accepts, field_filter.role)
+            for column, field_filter in self._filters.items()
+        )
+        self._refresh_fast_path()
+
+    def _refresh_fast_path(self) -> None:
+        """Accept every row without per-row work while nothing filters."""
+
+        self._fast_path = (
+            not self._active_filters
+            and self._accept_rule == FilterProxyModel.AcceptRule.DEFAULT
+            and not self.filterRegularExpression().pattern()
+        )
+
+    def setFilterRegularExpression(self, pattern) -> None:
+        super().setFilterRegularExpression(pattern)
+        self._refresh_fast_path()
+
+    def setFilterWildcard(self, pattern: str) -> None:
+        super().setFilterWildcard(pattern)
+        self._refresh_fast_path()
+
+    def setFilterFixedString(self, pattern: str) -> None:
+        super().setFilterFixedString(pattern)
+        self._refresh_fast_path()
+
+    def filterAcceptsRow(
+        self, source_row: int, source_parent: QtCore.QModelIndex
+    ) -> bool:
+        if self._fast_path:
+            return True
+
+        if self._accept_rule == FilterProxyModel.AcceptRule.DEFAULT:
+            pass
+        elif self._accept_rule == FilterProxyModel.AcceptRule.ALLOW_ALL:
+            return True
+        elif self._accept_rule == FilterProxyModel.AcceptRule.ALLOW_NONE:
+            return False
+
+        if not super().filterAcceptsRow(source_row, source_parent):
+            return False
+
+        source = self._source
+        for column, accepts, role in self._active_filters:
+            index = source.index(source_row, column, source_parent)
+            if not accepts(index.data(role)):
+                return False
+        return True
+
+    def lessThan(
+        self, source_left: QtCore.QModelIndex, source_right: QtCore.QModelIndex
+    ) -> bool:
+        # NOTE: The default implementation only handles built-in types.
+        column = source_left.column()
+        left = source_left.data(self.sort_role(column))
+        right = source_right.data(self.sort_role(column))
+
+        # Sort None first without allocating a tuple per comparison.
+        if left is None:
+            return right is not None
+        if right is None:
+            return False
+        if key := self._sort_keys.get(column):
+            left = key(left)
+            right = key(right)
+        try:
+            return left < right
+        except TypeError:
+            return True
+
+    def is_identity(self) -> bool:
+        """Return whether the proxy currently maps rows 1:1 to the source."""
+
+        if self._accept_rule != FilterProxyModel.AcceptRule.DEFAULT:
+            return False
+        if self.sortColumn() != -1 or self.filterRegularExpression().pattern():
+            return False
+        for field_filter in self._filters.values():
+            # Mirrors Filter.accepts: a filter is active when it has a match
+            # callable and a value that isn't falsy (0 counts as a value).
+            if field_filter.match is not None and (
+                field_filter.value or field_filter.value == 0
+            ):
+                return False
+        return True
+
+    def accept_rule(self) -> FilterProxyModel.AcceptRule:
+        return self._accept_rule
+
+    def set_accept_rule(self, accept_rule: FilterProxyModel.AcceptRule) -> None:
+        if accept_rule != self._accept_rule:
+            self._accept_rule = accept_rule
+            self._refresh_fast_path()
+            self.invalidateFilter()
+
+    def filter(self, column: int) -> Filter | None:
+        return self._filters.get(column)
+
+    def set_filter(self, column: int, filter_: Filter) -> None:
+        self._filters[column] = filter_
+        self._refresh_filters()
+
+    def set_filters(self, filters: dict) -> None:
+        self._filters = filters
+        self._refresh_filters()
+
+    def remove_filter(self, column: int) -> None:
+        if column in self._filters:
+            del self._filters[column]
+            self._refresh_filters()
+
+    def sort_role(self, column: int) -> int:
+        role = self._sort_roles.get(column, ItemDataRole.DisplayRole)
+        return role
+
+    def set_sort_role(self, column: int, role: ItemDataRole) -> None:
+        self._sort_roles[column] = role
+
+    def sort_key(self, column: int) -> Callable | None:
+        return self._sort_keys.get(column)
+
+    def set_sort_key(self, column: int, key: Callable) -> None:
+        """Set a comparator key for a column with homogeneous values."""
+
+        self._sort_keys[column] = key
+
+
+class StyledItemDelegate(QtWidgets.QStyledItemDelegate):
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+
+        self._padding = QtCore.QSize(0, 4)
+        self._size_hints: dict = {}
+
+    def sizeHint(
+        self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex
+    ) -> QtCore.QSize:
+        # Memoize per text; the hint runs per cell per layout pass and the
+        # same strings repeat across rows.
+        key = (index.column(), str(index.data() or ''), option.font.pointSize())
+        size_hint = self._size_hints.get(key)
+        if size_hint is None:
+            if len(self._size_hints) > 4096:
+                self._size_hints.clear()
+            size_hint = super().sizeHint(option, index) + self._padding
+            self._size_hints[key] = size_hint
+        return size_hint
+
+    def setModelData(
+        self,
+        editor: QtWidgets.QWidget,
+        model: QtCore.QAbstractItemModel,
+        index: QtCore.QModelIndex,
+        value: Any = None,
+    ) -> None:
+        """Set data on all selected rows."""
+
+        # Include the current index, in case it is not selected.
+        indexes = {index}
+        parent = self.parent()
+        if isinstance(parent, QtWidgets.QTreeView):
+            selection_model = parent.selectionModel()
+            indexes.update(selection_model.selectedRows(index.column()))
+
+        for i in indexes:
+            if value is None:
+                super().setModelData(editor, model, i)
+            else:
+                model.setData(i, value, QtCore.Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(
+        self,
+        editor: QtWidgets.QWidget,
+        option: QtWidgets.QStyleOption,
+        index: QtCore.QModelIndex,
+    ) -> None:
+        editor.setGeometry(option.rect)
+
+    def padding(self) -> QtCore.QSize:
+        return self._padding
+
+    def set_padding(self, padding: QtCore.QSize) -> None:
+        self._padding = padding
+        self._size_hints.clear()
+
+
+class ImageDelegate(QtWidgets.QStyledItemDelegate):
+    """Delegate to display image thumbnails."""
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._aspect_ratio = 16 / 9
+        self._max_width = 192
+        self._width = 64
+        self._size = self._get_size()
+        self._update_widget(parent)
+
+    def setParent(self, parent: QtCore.QObject | None) -> None:
+        super().setParent(parent)
+        self._update_widget(parent)
+
+    def _update_widget(self, parent: QtCore.QObject | None) -> None:
+        """Cache the widget and style; paint runs per visible cell."""
+
+        if isinstance(parent, QtWidgets.QWidget):
+            self._widget = parent
+            self._style = parent.style()
+        else:
+            self._widget = None
+            self._style = None
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> None:
+        widget = self._widget
+        if widget is None:
+            return
+
+        style = self._style
+        self.initStyleOption(option, index)
+        painter.save()
+        painter.setClipRect(option.rect)
+
+        # Panel
+        style.drawPrimitive(
+            QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem,
+            option,
+            painter,
+            widget,
+        )
+
+        # Pixmap
+        pixmap_rect = QtCore.QRect(option.rect)
+        pixmap_rect.setSize(self._size)
+        mode = QtGui.QIcon.Mode.Normal
+        if not option.state & StateFlag.State_Enabled:
+            mode = QtGui.QIcon.Mode.Disabled
+        elif option.state & StateFlag.State_Selected:
+            mode = QtGui.QIcon.Mode.Selected
+
+        if option.state & StateFlag.State_Open == StateFlag.State_Open:
+            state = QtGui.QIcon.State.On
+        else:
+            state = QtGui.QIcon.State.Off
+        option.icon.paint(painter, pixmap_rect, option.decorationAlignment, mode, state)
+
+        # Focus Rect
+        if option.state & StateFlag.State_HasFocus:
+            option_focus = QtWidgets.QStyleOptionFocusRect()
+            option_focus.rect = option.rect
+            option_focus.state = option.state
+            option_focus.state |= StateFlag.State_KeyboardFocusChange
+            option_focus.state |= StateFlag.State_Item
+
+            if option.state & StateFlag.State_Enabled:
+                color_group = QtGui.QPalette.ColorGroup.Normal
+            else:
+                color_group = QtGui.QPalette.ColorGroup.Disabled
+
+            if option.state & StateFlag.State_Selected:
+                role = QtGui.QPalette.ColorRole.Highlight
+            else:
+                role = QtGui.QPalette.ColorRole.Window
+            option_focus.backgroundColor = option.palette.color(color_group, role)
+            style.drawPrimitive(
+                QtWidgets.QStyle.PrimitiveElement.PE_FrameFocusRect,
+                option_focus,
+                painter,
+                widget,
+            )
+
+        painter.restore()
+
+    def sizeHint(
+        self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex
+    ) -> QtCore.QSize:
+        return self._size
+
+    def aspect_ratio(self) -> float:
+        return self._aspect_ratio
+
+    def set_aspect_ratio(self, aspect_ratio: float) -> None:
+        self._aspect_ratio = aspect_ratio
+        self._size = self._get_size()
+
+    def max_width(self) -> int:
+        return self._max_width
+
+    def set_max_width(self, max_width: int) -> None:
+        self._max_width = max_width
+        self._size = self._get_size()
+
+    def width(self) -> int:
+        return self._width
+
+    def set_width(self, width: int) -> None:
+        self._width = min(width, self._max_width)
+        self._size = self._get_size()
+
+    def _get_size(self) -> QtCore.QSize:
+        return QtCore.QSize(self._width, int(self._width / self._aspect_ratio))
+
+
+class DateDelegate(StyledItemDelegate):
+    def displayText(self, value: QtCore.QDateTime, locale: QtCore.QLocale) -> str:
+        return value.toLocalTime().toString()
+
+
+class MaterialStyle(QtWidgets.QProxyStyle):
+    def drawControl(
+        self,
+        element: QtWidgets.QStyle.ControlElement,
+        option: QtWidgets.QStyleOption,
+        painter: QtGui.QPainter,
+        widget: QtWidgets.QWidget | None = None,
+    ) -> None:
+        if element == QtWidgets.QStyle.ControlElement.CE_HeaderSection:
+            frame_option = QtWidgets.QStyleOptionFrame()
+            frame_option.rect = option.rect
+            frame_option.frameShape = QtWidgets.QFrame.Shape.StyledPanel
+            element = QtWidgets.QStyle.ControlElement.CE_ShapedFrame
+            super().drawControl(element, frame_option, painter, widget)
+            return
+        elif element == QtWidgets.QStyle.ControlElement.CE_HeaderLabel:
+            option.rect.adjust(8, 0, -8, 0)
+        super().drawControl(element, option, painter, widget)
+
+
+class ElementTree(QtWidgets.QTreeView):
+    selection_changed = QtCore.Signal()
+    # The checked_changed Signal is disabled by default.
+    # Set enable_checked_signal = True to enable it.
+    checked_changed = QtCore.Signal()
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+
+        self._checked = set()
+
+        # Initialize QTreeView
+        mode = QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection
+        self.setSelectionMode(mode)
+        behavior = QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
+        self.setSelectionBehavior(behavior)
+        self.setSortingEnabled(True)
+        # Rows share one height; without this the view queries the delegate
+        # sizeHint per row on every layout.
+        self.setUniformRowHeights(True)
+
+        # Parent the delegate to enable setModelData on selection
+        delegate = StyledItemDelegate(parent=self)
+        self.setItemDelegate(delegate)
+
+        # Initialize Header
+        header = self.header()
+        header.setMinimumHeight(32)
+        header.setTextElideMode(QtCore.Qt.TextElideMode.ElideRight)
+        header.setStretchLastSection(True)
+        header.sectionResized.connect(self._header_resized)
+
+        # Only check when enabled for optimization
+        self.enable_checked_signal = False
+
+        # Coalesce per-row size hint updates while a header drags.
+        self._pending_resize_column = -1
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._emit_size_hints_changed)
+
+        # self.proxy_style = MaterialStyle(header.style().objectName())
+        # self.proxy_style.setParent(header)
+        # header.setStyle(self.proxy_style)
+
+    def dataChanged(
+        self,
+        top_left: QtCore.QModelIndex,
+        bottom_right: QtCore.QModelIndex,
+        roles: Sequence[QtCore.Qt.ItemDataRole] = (),
+    ) -> None:
+        is_checked_role = QtCore.Qt.ItemDataRole.CheckStateRole in roles
+        if self.enable_checked_signal and is_checked_role:
+            # Reconcile only the changed range; rebuilding the full checked
+            # set walked the whole tree per toggle.
+            model = self.model()
+            is_proxy = isinstance(model, QtCore.QSortFilterProxyModel)
+            source = model.sourceModel() if is_proxy else model
+            is_standard = isinstance(source, QtGui.QStandardItemModel)
+            parent = top_left.parent()
+            state = QtCore.Qt.CheckState.Checked
+            changed = False
+            for row in range(top_left.row(), bottom_right.row() + 1):
+                index = model.index(row, 0, parent)
+                if is_proxy:
+                    index = model.mapToSource(index)
+                key = QtCore.QPersistentModelIndex(index)
+                item = source.itemFromIndex(index) if is_standard else None
+                checked = item is not None and item.checkState() == state
+                if checked:
+                    if key not in self._checked:
+                        self._checked.add(key)
+                        changed = True
+                elif key in self._checked:
+                    self._checked.discard(key)
+                    changed = True
+            if changed:
+                self.checked_changed.emit()
+        super().dataChanged(top_left, bottom_right, roles)
+
+    def sync_checked(self) -> None:
+        """Rebuild the checked set after bulk check-state changes."""
+
+        self._checked = {
+            QtCore.QPersistentModelIndex(item.index()) for item in self.checked_items()
+        }
+
+    def expandToDepth(self, depth: int) -> None:
+        """
+        Expand items up to a depth. If the depth is negative, expand relative to the
+        leaf node.
+        """
+
+        # HACK: The built-in method does not seem to work. Maybe the ProxyModels?
+
+        if depth > 0:
+            # Qt expands recursively in C++; the Python walk was the cost.
+            model = self.model()
+            for row in range(model.rowCount()):
+                index = model.index(row, 0)
+                if index.isValid():
+                    self.expandRecursively(index, depth - 1)
+        elif depth < 0:
+            self.expandAll()
+            self._collapse_to_depth(depth)
+        else:
+            self.expandAll()
+
+    def _collapse_to_depth(
+        self, depth: int, index: QtCore.QModelIndex | None = None
+    ) -> int:
+        """Return the depth of the index and collapse it if it is above the depth."""
+
+        if index is None:
+            index = QtCore.QModelIndex()
+        current_depth = -1
+
+        model = self.model()
+        for row in range(model.rowCount(index)):
+            child = model.index(row, 0, index)
+            if child.isValid():
+                child_depth = self._collapse_to_depth(depth, index=child)
+                current_depth = min(current_depth, child_depth - 1)
+
+        if current_depth >= depth and index.isValid():
+            self.collapse(index)
+
+        return current_depth
+
+    def selectionChanged(
+        self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection
+    ) -> None:
+        self.selection_changed.emit()
+        super().selectionChanged(selected, deselected)
+
+    def checked_items(
+        self, parent: QtCore.QModelIndex | None = None
+    ) -> tuple[QtGui.QStandardItem, ...]:
+        """Return checked QStandardItems from the list."""
+
+        items = []
+
+        if parent is None:
+            parent = QtCore.QModelIndex()
+
+        model = self.model()
+        if isinstance(model, QtCore.QSortFilterProxyModel):
+            model = model.sourceModel()
+        if isinstance(model, QtGui.QStandardItemModel):
+            checked = QtCore.Qt.CheckState.Checked
+            append = items.append
+            stack = [parent]
+            while stack:
+                parent = stack.pop()
+                for row in range(model.rowCount(parent)):
+                    index = model.index(row, 0, parent)
+                    if not index.isValid():
+                        continue
+                    stack.append(index)
+                    item = model.itemFromIndex(index)
+                    if item and item.checkState() == checked:
+                        append(item)
+        return tuple(items)
+
+    def resize_columns(self, padding: int = 8) -> None:
+        """Resize columns with horizontal padding taking all rows into account."""
+
+        model = self.model()
+        if model and model.rowCount():
+            # Suppress paints during the expand/measure/collapse cycle.
+            self.setUpdatesEnabled(False)
+            try:
+                self.expandAll()
+                for column in range(model.columnCount()):
+                    # Using sizeHint keeps the last column narrow
+                    width = self.header().sectionSizeHint(column)
+                    width = max(width, self.sizeHintForColumn(column))
+                    width += padding
+                    self.setColumnWidth(column, width)
+                self.collapseAll()
+            finally:
+                self.setUpdatesEnabled(True)
+
+    def _header_resized(self, column: int, old: int, new: int) -> None:
+        """Resize ImageDelegates when the header resized."""
+
+        delegate = self.itemDelegateForColumn(column)
+        if isinstance(delegate, ImageDelegate):
+            delegate.set_width(new)
+            if new < delegate.max_width():
+                # sectionResized fires per mouse move; emit the hints once
+                # the drag settles.
+                self._pending_resize_column = column
+                self._resize_timer.start()
+
+    def _emit_size_hints_changed(self) -> None:
+        column = self._pending_resize_column
+        self._pending_resize_column = -1
+        if column < 0:
+            return
+        delegate = self.itemDelegateForColumn(column)
+        if isinstance(delegate, ImageDelegate):
+            model = self.model()
+            for row in range(model.rowCount()):
+                delegate.sizeHintChanged.emit(model.index(row, column))
+            self.scheduleDelayedItemsLayout()
+
+
+@lru_cache(maxsize=None)
+def _split_name(name: str) -> tuple[str, ...]:
+    """Split an attribute name once; the names are a small repeated set."""
+
+    return tuple(name.split(ATTRIBUTE_SEPARATOR)) if name else ()
+
+
+def get_value(obj: Any, name: str) -> Any:
+    """
+    Return the value from an object's attribute. Attribute name can be separated by
+    a dot.
+    """
+
+    value = obj
+    for attribute in _split_name(name):
+        value = getattr(value, attribute, None)
+    return value
+
+
+def set_value(obj: Any, name: str, value: Any) -> None:
+    """Set the attribute on an object, creating an object structure if needed."""
+
+    if obj is None:
+        return
+
+    attributes = _split_name(name)
+    for attribute in attributes[:-1]:
+        child = getattr(obj, attribute, None)
+        if child is None:
+            namespace = SimpleNamespace()
+            setattr(obj, attribute, namespace)
+            child = namespace
+        obj = child
+    setattr(obj, attributes[-1], value)
+
+
+_default_thumbnail: QtGui.QPixmap | None = None
+
+
+def get_default_thumbnail() -> QtGui.QPixmap:
+    # A plain module global; the lru wrapper added a hash lookup per row
+    # and pixmaps can only be created once a QApplication exists.
+    global _default_thumbnail
+    if _default_thumbnail is not None:
+        return _default_thumbnail
+
+    size = QtCore.QSize(192, 108)
+    icon_size = QtCore.QSize(48, 48)
+
+    pixmap = QtGui.QPixmap(size)
+    palette = QtWidgets.QApplication.palette()
+    color = palette.color(
+        QtGui.QPalette.ColorGroup.Normal, QtGui.QPalette.ColorRole.Shadow
+    )
+    pixmap.fill(color)
+
+    icon = MaterialIcon('image')
+    icon_pixmap = icon.pixmap(size=icon_size, mode=QtGui.QIcon.Mode.Disabled)
+
+    x = (size.width() - icon_size.width()) // 2
+    y = (size.height() - icon_size.height()) // 2
+    origin = QtCore.QPoint(x, y)
+
+    painter = QtGui.QPainter(pixmap)
+    painter.drawPixmap(origin, icon_pixmap)
+    painter.end()
+
+    _default_thumbnail = pixmap
+    return pixmap
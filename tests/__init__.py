@@ -7,17 +7,35 @@ from qtpy import QtWidgets
 
 import pathmanager
 
+_app: QtWidgets.QApplication | None = None
+_owned = False
+_depth = 0
+
 
 @contextlib.contextmanager
 def application() -> Generator[QtWidgets.QApplication, None]:
-    if app := QtWidgets.QApplication.instance():
+    """Yield the process QApplication, creating it on first use."""
+
+    global _app, _owned, _depth
+
+    if _app is None:
+        app = QtWidgets.QApplication.instance()
         if isinstance(app, QtWidgets.QApplication):
-            yield app
-            return
+            _app = app
+        else:
+            _app = QtWidgets.QApplication(sys.argv)
+            _owned = True
+
+    _depth += 1
+    try:
+        yield _app
+    finally:
+        _depth -= 1
 
-    app = QtWidgets.QApplication(sys.argv)
-    yield app
-    app.exec()
+    # Only the outermost context of an application we created runs the loop.
+    if _owned and not _depth:
+        _owned = False
+        _app.exec()
 
 
 def init() -> None:
@@ -1,8 +1,9 @@
 import logging
 import os
+from collections import defaultdict
 
 import tests
-from pathmanager.utils import find_files
+from pathmanager.utils import _compile_patterns, find_files
 
 if __name__ == '__main__':
     tests.init()
@@ -21,8 +22,27 @@ if __name__ == '__main__':
         os.path.join(data_dir, 'sequence.%04d.png'),
     ]
 
+    # Group the patterns by directory and list each directory once; every
+    # pattern is matched against the same entries in a single sweep, and the
+    # sweep is checked against the public find_files per path.
+    by_dir = defaultdict(list)
     for path in test_paths:
-        logging.info(f'{path=}')
-        files = find_files(path)
-        for file in files:
-            logging.info(f'    {file}')
+        by_dir[os.path.dirname(path)].append(path)
+
+    for directory, paths in by_dir.items():
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(entry.path for entry in it)
+        except OSError:
+            entries = []
+
+        for path in paths:
+            logging.info(f'{path=}')
+            files = find_files(path)
+            for file in files:
+                logging.info(f'    {file}')
+
+            re_compile, _ = _compile_patterns(path)
+            if re_compile is not None:
+                matches = tuple(f for f in entries if re_compile.fullmatch(f))
+                assert matches == files, (path, matches, files)
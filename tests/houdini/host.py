@@ -1,22 +1,40 @@
 import dataclasses
+import fnmatch
 import glob
+import hashlib
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Sequence
 
 import tests
 from pathmanager import schema
 from pathmanager.schema import Item, NodeType, ParmTypes, Statuses
 
+_COLLECTION_PATTERN = re.compile(r'\$F{?\d*}?|<UDIM>')
+_NODE_TYPE_IMAGE_SOP = NodeType('image', 'sop')
 
-nodes = []
+_VAR_PATTERN = re.compile(r'\$(HIP|JOB)')
+_VAR_MAP = {'HIP': '/projects/test/houdini', 'JOB': '/projects/test'}
 
+nodes: dict[str, 'Node'] = {}
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class Node:
     path: str
     node_path: str
+    needs_expand: bool = True
+
+    def __post_init__(self) -> None:
+        self.set_path(self.path)
+
+    def set_path(self, path: str) -> None:
+        self.path = path
+        # Literal paths skip the expand/substitute pipeline entirely.
+        self.needs_expand = '$' in path or '<UDIM>' in path
 
 
 class HoudiniHost:
@@ -26,37 +44,60 @@ class HoudiniHost:
         self._generate_data()
 
     def get_items(self, selected: bool = False) -> tuple[Item, ...]:
-        items = []
-        for node in nodes:
-            if '`' in node.path:
-                status = Statuses.EXPRESSION
-            else:
-                files = HoudiniHost.expand_files(node.path)
-                if files:
-                    status = Statuses.FOUND
-                else:
-                    status = Statuses.MISSING
-
-            item = Item(
+        # Nodes commonly share a directory; list each one once per scan.
+        dir_cache: dict[str, list[str]] = {}
+
+        # Expression nodes need no I/O; expand the rest through a thread
+        # pool since the filesystem calls release the GIL. Small scans skip
+        # the pool overhead.
+        io_nodes = [node for node in nodes.values() if '`' not in node.path]
+        if len(io_nodes) > 4:
+            with ThreadPoolExecutor(max_workers=min(32, len(io_nodes))) as executor:
+                results = executor.map(
+                    lambda node: _node_has_files(node, dir_cache), io_nodes
+                )
+                found = {id(node): f for node, f in zip(io_nodes, results)}
+        else:
+            found = {id(node): _node_has_files(node, dir_cache) for node in io_nodes}
+
+        # Bind the status singletons to locals for the per-node loop.
+        expression = Statuses.EXPRESSION
+        found_status = Statuses.FOUND
+        missing = Statuses.MISSING
+
+        # Many nodes share identical raw paths; share one Path per string.
+        path_cache: dict[str, Item.Path] = {}
+
+        def item_path(path: str) -> Item.Path:
+            cached = path_cache.get(path)
+            if cached is None:
+                cached = path_cache[path] = Item.Path(raw=path, expanded=path)
+            return cached
+
+        return tuple(
+            Item(
                 parm_name='file',
                 parm_type=ParmTypes.IMAGE,
                 node_path=node.node_path,
-                node_type=NodeType('image', 'sop'),
-                path=Item.Path(raw=node.path, expanded=node.path),
-                status=status,
+                node_type=_NODE_TYPE_IMAGE_SOP,
+                path=item_path(node.path),
+                status=(
+                    expression
+                    if '`' in node.path
+                    else found_status if found[id(node)] else missing
+                ),
             )
-            items.append(item)
-        return tuple(items)
+            for node in nodes.values()
+        )
 
     def update_items(self, items: Sequence[schema.Item]) -> None:
-        nodes_data = {node.node_path: node for node in nodes}
         for item in items:
             if item.preview.raw:
-                node = nodes_data[item.node_path]
-                node.path = item.preview.raw
+                node = nodes[item.node_path]
+                node.set_path(item.preview.raw)
                 print(item.preview.raw)
         print('--')
-        for node in nodes:
+        for node in nodes.values():
             print(node.path)
 
     @staticmethod
@@ -69,7 +110,7 @@ class HoudiniHost:
 
         source_dir = os.path.join(tests_dir, 'data', 'source')
         destination_dir = os.path.join(tests_dir, 'data', 'destination')
-        shutil.rmtree(destination_dir)
+        shutil.rmtree(destination_dir, ignore_errors=True)
         os.makedirs(destination_dir, exist_ok=True)
 
         # Generate files
@@ -111,98 +152,188 @@ class HoudiniHost:
                 )
                 paths.append(path)
 
-        for path in paths:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w') as f:
-                f.write('')
+        # Skip the create burst when the source files are already in place.
+        signature = hashlib.sha1('\n'.join(sorted(paths)).encode()).hexdigest()
+        signature_path = os.path.join(source_dir, '.sig')
+        try:
+            with open(signature_path) as f:
+                if f.read() == signature:
+                    return
+        except OSError:
+            pass
+
+        # Create each directory once, then the empty files through a thread
+        # pool; most paths share a handful of directories.
+        for directory in {os.path.dirname(path) for path in paths}:
+            os.makedirs(directory, exist_ok=True)
+
+        def touch(path: str) -> None:
+            # A raw open/close pair; open() builds the whole io stack for a
+            # zero-byte file.
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            os.close(os.open(path, flags, 0o644))
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(touch, paths))
+
+        with open(signature_path, 'w') as f:
+            f.write(signature)
 
     @staticmethod
     def expand_string(text: str, preserve_frame: bool = False) -> str:
-        text = text.replace('$HIP', '/projects/test/houdini')
-        text = text.replace('$JOB', '/projects/test')
-        return text
+        # One pass and one allocation; most paths have no variables at all.
+        if '$' not in text:
+            return text
+        return _VAR_PATTERN.sub(lambda m: _VAR_MAP[m.group(1)], text)
 
     @staticmethod
     def expand_files(path: str) -> tuple[str, ...]:
-        absolute_path = HoudiniHost.expand_string(path)
-        glob_pattern = re.sub(r'\$F{?\d*}?|<UDIM>', '*', absolute_path)
+        return _expand_files(path, {})
+
+
+def _list_dir(directory: str, dir_cache: dict[str, list[str]]) -> list[str]:
+    entries = dir_cache.get(directory)
+    if entries is None:
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            entries = []
+        dir_cache[directory] = entries
+    return entries
+
+
+@lru_cache(maxsize=1024)
+def _to_glob(path: str) -> str:
+    """Translate a raw path to its glob pattern, cached per unique path."""
+
+    return _COLLECTION_PATTERN.sub('*', HoudiniHost.expand_string(path))
+
+
+def _expand_files(path: str, dir_cache: dict[str, list[str]]) -> tuple[str, ...]:
+    """Expand a path to files, reusing directory listings from dir_cache."""
+
+    glob_pattern = _to_glob(path)
+
+    # Literal paths need a single stat.
+    if not any(c in glob_pattern for c in '*?['):
+        return (glob_pattern,) if os.path.lexists(glob_pattern) else ()
+
+    # When only the file name has wildcards, one listing beats glob's
+    # normalize/list/stat pipeline.
+    head, tail = os.path.split(glob_pattern)
+    if head and not any(c in head for c in '*?['):
+        files = [
+            os.path.join(head, name)
+            for name in _list_dir(head, dir_cache)
+            if fnmatch.fnmatchcase(name, tail)
+        ]
+    else:
         files = glob.glob(glob_pattern)
-        return tuple(sorted(files))
+    files.sort()
+    return tuple(files)
+
+
+def _node_has_files(node: Node, dir_cache: dict[str, list[str]]) -> bool:
+    """Return whether a node's path resolves to at least one file."""
+
+    if not node.needs_expand and not any(c in node.path for c in '*?['):
+        return os.path.lexists(node.path)
+    return _has_files(node.path, dir_cache)
+
+
+def _has_files(path: str, dir_cache: dict[str, list[str]]) -> bool:
+    """
+    Return whether a path expands to at least one file.
+    Unlike _expand_files this stops at the first match and never sorts.
+    """
+
+    glob_pattern = _to_glob(path)
+    if not any(c in glob_pattern for c in '*?['):
+        return os.path.lexists(glob_pattern)
+    head, tail = os.path.split(glob_pattern)
+    if head and not any(c in head for c in '*?['):
+        entries = _list_dir(head, dir_cache)
+        return any(fnmatch.fnmatchcase(name, tail) for name in entries)
+    return next(glob.iglob(glob_pattern), None) is not None
 
 
 def populate_nodes() -> None:
     tests_dir = os.path.dirname(os.path.abspath(tests.__file__))
     source_dir = os.path.join(tests_dir, 'data', 'source')
 
+    # Hoist the repeated joins out of the loops.
+    texture_paths = [os.path.join(source_dir, f'texture_{i:03d}.png') for i in range(4)]
+    udim_paths = [os.path.join(source_dir, f'texture{i}.<UDIM>.png') for i in range(2)]
+    sequence_path = os.path.join(source_dir, 'sequence.$F4.png')
+    v001_dir = os.path.join(source_dir, 'v001')
+
+    new_nodes = []
+
     # Expression
-    for i in range(2):
-        node = Node(
+    new_nodes.extend(
+        Node(
             node_path=f'/stage/expression_{i}',
             path='$HIP/geo/cube/v1/`$OS`.$F4.bgeo.sc',
         )
-        nodes.append(node)
+        for i in range(2)
+    )
 
     # Geometry
-    for i in range(2):
-        node = Node(
+    new_nodes.extend(
+        Node(
             node_path=f'/stage/geometry_{i}',
             path='$HIP/geo/cube/v1/cube.$F4.bgeo.sc',
         )
-        nodes.append(node)
-
-        node = Node(
+        for i in range(2)
+    )
+    new_nodes.extend(
+        Node(
             node_path=f'/stage/geometry2_{i}',
             path='$HIP/geo/cube/v2/cube.$F4.bgeo.sc',
         )
-        nodes.append(node)
+        for i in range(2)
+    )
 
     # Textures
-    for i in range(4):
-        for j in range(2):
-            path = os.path.join(source_dir, f'texture_{i:03d}.png')
-
-            node = Node(
-                node_path=f'/stage/material/image_{j}_{i}',
-                path=path,
-            )
-            nodes.append(node)
+    new_nodes.extend(
+        Node(node_path=f'/stage/material/image_{j}_{i}', path=texture_paths[i])
+        for i in range(4)
+        for j in range(2)
+    )
 
     # UDIM
-    for i in range(2):
-        path = os.path.join(source_dir, f'texture{i}.<UDIM>.png')
-        node = Node(
-            node_path=f'/stage/material/image_udim_{i}',
-            path=path,
-        )
-        nodes.append(node)
+    new_nodes.extend(
+        Node(node_path=f'/stage/material/image_udim_{i}', path=udim_paths[i])
+        for i in range(2)
+    )
 
     # File sequence
-    path = os.path.join(source_dir, f'sequence.$F4.png')
-    for i in range(2):
-        node = Node(
-            node_path=f'/stage/material/image_sequence_{i}',
-            path=path,
-        )
-        nodes.append(node)
+    new_nodes.extend(
+        Node(node_path=f'/stage/material/image_sequence_{i}', path=sequence_path)
+        for i in range(2)
+    )
 
     # Versions
-    node = Node(
-        node_path=f'/stage/geometry_version_0',
-        path=os.path.join(source_dir, 'v001', f'cube_v001.bgeo.sc'),
+    new_nodes.append(
+        Node(
+            node_path='/stage/geometry_version_0',
+            path=os.path.join(v001_dir, 'cube_v001.bgeo.sc'),
+        )
     )
-    nodes.append(node)
-
-    node = Node(
-        node_path=f'/stage/geometry_version_1',
-        path=os.path.join(source_dir, 'v001', f'cube_v001.$F4.bgeo.sc'),
+    new_nodes.append(
+        Node(
+            node_path='/stage/geometry_version_1',
+            path=os.path.join(v001_dir, 'cube_v001.$F4.bgeo.sc'),
+        )
     )
-    nodes.append(node)
-
-    node = Node(
-        node_path=f'/stage/geometry_version_2',
-        path=os.path.join(source_dir, 'v005', f'cube_v005.$F4.bgeo.sc'),
+    new_nodes.append(
+        Node(
+            node_path='/stage/geometry_version_2',
+            path=os.path.join(source_dir, 'v005', 'cube_v005.$F4.bgeo.sc'),
+        )
     )
-    nodes.append(node)
+
+    nodes.update((node.node_path, node) for node in new_nodes)
 
 
 populate_nodes()